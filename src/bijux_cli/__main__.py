@@ -18,8 +18,9 @@ Key responsibilities include:
         all commands and dynamic plugins.
     * **Execution and Error Handling:** Invokes the Typer application, catches
         all top-level exceptions (including `Typer` errors, custom `CommandError`
-        exceptions, and `KeyboardInterrupt`), and translates them into
-        structured error messages and standardized exit codes.
+        exceptions, and `KeyboardInterrupt` or the `click.Abort` it becomes
+        inside a command), and translates them into structured error messages
+        and standardized exit codes.
     * **History Recording:** Persists the command to the history service after
         execution.
 """
@@ -168,6 +169,20 @@ def disable_cli_colors_for_test() -> None:
         pass
 
 
+def announce_ready() -> None:
+    """Writes a readiness sentinel to stderr for process supervisors.
+
+    When the `BIJUXCLI_READY_SENTINEL` environment variable is set to "1", a
+    single `\\x00ready` line is written once start-up is complete and the
+    command is about to run, so a supervising process can wait for it
+    instead of sleeping before it signals the CLI.
+    """
+    if os.environ.get("BIJUXCLI_READY_SENTINEL") != "1":
+        return
+    sys.stderr.write("\x00ready\n")
+    sys.stderr.flush()
+
+
 def should_record_command_history(command_line: list[str]) -> bool:
     """Determines whether the given command should be recorded in the history.
 
@@ -354,6 +369,10 @@ def main() -> int:
         print(json.dumps({"version": ver}))
         return 0
 
+    if any(a in ("-h", "--help") for a in args):
+        print(get_usage_for_args(args, build_app()))
+        return 0
+
     container = DIContainer.current()
     register_default_services(
         container, debug=False, output_format=OutputFormat.JSON, quiet=False
@@ -362,10 +381,6 @@ def main() -> int:
     Engine()
     app = build_app()
 
-    if any(a in ("-h", "--help") for a in args):
-        print(get_usage_for_args(args, app))
-        return 0
-
     missing_format_msg = check_missing_format_argument(args)
     if missing_format_msg:
         print_json_error(missing_format_msg, 2, quiet)
@@ -376,6 +391,7 @@ def main() -> int:
     exit_code = 0
 
     try:
+        announce_ready()
         result = app(args=command_line, standalone_mode=False)
         exit_code = int(result) if isinstance(result, int) else 0
     except typer.Exit as exc:
@@ -389,7 +405,7 @@ def main() -> int:
     except CommandError as exc:
         print_json_error(str(exc), 1, quiet)
         exit_code = 1
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, click.exceptions.Abort):
         print_json_error("Aborted by user", 130, quiet)
         exit_code = 130
     except Exception as exc:
@@ -12,7 +12,8 @@ The `memory` command, when run without a subcommand, provides a brief summary
 of the memory store's state.
 
 The available subcommands are:
-    * `set`: Sets a key-value pair.
+    * `set`: Sets a key-value pair, or a batch of them read from stdin with
+        `--stdin`.
     * `get`: Retrieves the value for a specific key.
     * `delete`: Removes a key-value pair.
     * `list`: Lists all defined keys.
@@ -7,22 +7,33 @@ This module contains the logic for storing a key-value pair in a transient,
 in-memory data store. The data persists only for the lifetime of the
 application's parent process. A structured confirmation is emitted upon success.
 
+With `--stdin`, KEY and VALUE are omitted and a batch of `KEY=VALUE` lines
+is read from standard input and stored in a single invocation. Blank lines
+are ignored, a value may itself contain `=`, and when a key repeats the last
+value wins. A batch with no pairs is rejected.
+
 Output Contract:
     * Success: `{"status": "updated", "key": str, "value": str}`
+    * Batch:   `{"status": "updated", "keys": list[str], "count": int}`, where
+      `keys` lists each distinct key once, in first-seen order.
     * Verbose: Adds `{"python": str, "platform": str}` to the payload.
     * Error:   `{"error": str, "code": int}`
 
 Exit Codes:
     * `0`: Success.
     * `1`: An unexpected error occurred (e.g., service unavailable, set failed).
-    * `2`: The provided key was invalid.
+    * `2`: The provided key was invalid, KEY or VALUE was missing, or the
+      arguments or batch were malformed or empty.
 """
 
 from __future__ import annotations
 
 from collections.abc import Mapping
 import platform
+import sys
+from typing import NoReturn, cast
 
+import click
 import typer
 
 from bijux_cli.commands.memory.utils import resolve_memory_service
@@ -60,44 +71,173 @@ def _build_payload(include_runtime: bool, key: str, value: str) -> Mapping[str,
     return payload
 
 
+def _build_batch_payload(
+    include_runtime: bool, keys: list[str]
+) -> Mapping[str, object]:
+    """Constructs the payload confirming a batch of key-value pairs was set.
+
+    Args:
+        include_runtime (bool): If True, includes Python and platform info.
+        keys (list[str]): The distinct keys that were updated, in first-seen
+            order.
+
+    Returns:
+        Mapping[str, object]: A dictionary containing the status, the updated
+            keys, their count, and optional runtime metadata.
+    """
+    payload: dict[str, object] = {
+        "status": "updated",
+        "keys": keys,
+        "count": len(keys),
+    }
+    if include_runtime:
+        payload["python"] = ascii_safe(platform.python_version(), "python_version")
+        payload["platform"] = ascii_safe(platform.platform(), "platform")
+    return payload
+
+
+def _is_valid_key(key: str) -> bool:
+    """Checks that a memory key is 1-4096 printable, non-space characters.
+
+    Args:
+        key (str): The key to validate.
+
+    Returns:
+        bool: True if the key is valid, otherwise False.
+    """
+    return 1 <= len(key) <= 4096 and all(
+        c.isprintable() and not c.isspace() for c in key
+    )
+
+
+def _parse_batch(text: str) -> list[tuple[str, str]] | None:
+    """Parses `KEY=VALUE` lines, ignoring blank lines.
+
+    Args:
+        text (str): The raw batch text read from stdin.
+
+    Returns:
+        list[tuple[str, str]] | None: The parsed pairs in input order, or None
+            if any non-blank line lacks an `=` separator.
+    """
+    pairs: list[tuple[str, str]] = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if "=" not in line:
+            return None
+        key, value = line.split("=", 1)
+        pairs.append((key, value))
+    return pairs
+
+
+def _raise_missing_argument(name: str) -> NoReturn:
+    """Raises Click's standard usage error for a missing positional argument.
+
+    KEY and VALUE are declared optional so that `--stdin` can omit them, which
+    stops Click from enforcing them; this restores its error for the plain
+    form, and their metavars keep the usage line reading `KEY VALUE`.
+
+    Args:
+        name (str): The parameter name, "key" or "value".
+
+    Raises:
+        click.MissingParameter: Always.
+    """
+    ctx = click.get_current_context(silent=True)
+    params = ctx.command.params if ctx is not None else []
+    param = next((p for p in params if p.name == name), None)
+    raise click.MissingParameter(ctx=ctx, param=param, param_type="argument")
+
+
 def set_memory(
-    key: str = typer.Argument(..., help="Key to set"),
-    value: str = typer.Argument(..., help="Value to set"),
+    key: str | None = typer.Argument(None, metavar="KEY", help="Key to set"),
+    value: str | None = typer.Argument(None, metavar="VALUE", help="Value to set"),
     quiet: bool = typer.Option(False, "-q", "--quiet", help=HELP_QUIET),
     verbose: bool = typer.Option(False, "-v", "--verbose", help=HELP_VERBOSE),
     fmt: str = typer.Option("json", "-f", "--format", help=HELP_FORMAT),
     pretty: bool = typer.Option(True, "--pretty/--no-pretty", help=HELP_NO_PRETTY),
     debug: bool = typer.Option(False, "-d", "--debug", help=HELP_DEBUG),
+    from_stdin: bool = typer.Option(
+        False, "--stdin", help="Read KEY=VALUE lines from stdin and set them all."
+    ),
 ) -> None:
-    """Sets a key-value pair in the transient in-memory store.
+    """Sets one or more key-value pairs in the transient in-memory store.
 
     This command validates the key's format and then stores the key-value
-    pair using the memory service.
+    pair using the memory service. KEY and VALUE are required unless
+    `--stdin` is given. With `--stdin`, they are omitted and every `KEY=VALUE`
+    line on standard input is set instead: blank lines are skipped, the value
+    is everything after the first `=`, and a repeated key keeps its last
+    value. The whole batch is validated before anything is stored, so a
+    malformed or empty batch leaves the store untouched.
 
     Args:
-        key (str): The memory key to set. Must be between 1 and 4096 printable,
-            non-whitespace characters.
-        value (str): The value to associate with the key.
+        key (str | None): The memory key to set. Must be between 1 and 4096
+            printable, non-whitespace characters. Omitted with `--stdin`.
+        value (str | None): The value to associate with the key. Omitted
+            with `--stdin`.
         quiet (bool): If True, suppresses all output except for errors.
         verbose (bool): If True, includes Python/platform details in the output.
         fmt (str): The output format, "json" or "yaml".
         pretty (bool): If True, pretty-prints the output.
         debug (bool): If True, enables debug diagnostics.
+        from_stdin (bool): If True, reads the pairs to set from stdin.
 
     Returns:
         None:
 
     Raises:
+        click.MissingParameter: If KEY or VALUE is omitted without `--stdin`.
         SystemExit: Always exits with a contract-compliant status code and
             payload, indicating success or detailing an error.
     """
     command = "memory set"
 
+    if not from_stdin and (key is None or value is None):
+        _raise_missing_argument("key" if key is None else "value")
+
     fmt_lower = validate_common_flags(fmt, command, quiet)
 
-    if not (
-        1 <= len(key) <= 4096 and all(c.isprintable() and not c.isspace() for c in key)
-    ):
+    if from_stdin:
+        if key is not None or value is not None:
+            emit_error_and_exit(
+                "Invalid argument: --stdin cannot be combined with KEY or VALUE",
+                code=2,
+                failure="invalid_argument",
+                command=command,
+                fmt=fmt_lower,
+                quiet=quiet,
+                include_runtime=verbose,
+                debug=debug,
+            )
+        pairs = _parse_batch(sys.stdin.read())
+        if pairs is None:
+            emit_error_and_exit(
+                "Invalid argument: each stdin line must be KEY=VALUE",
+                code=2,
+                failure="invalid_argument",
+                command=command,
+                fmt=fmt_lower,
+                quiet=quiet,
+                include_runtime=verbose,
+                debug=debug,
+            )
+        if not pairs:
+            emit_error_and_exit(
+                "Invalid argument: no KEY=VALUE lines on stdin",
+                code=2,
+                failure="invalid_argument",
+                command=command,
+                fmt=fmt_lower,
+                quiet=quiet,
+                include_runtime=verbose,
+                debug=debug,
+            )
+    else:
+        pairs = [(cast(str, key), cast(str, value))]
+
+    if not all(_is_valid_key(k) for k, _ in pairs):
         emit_error_and_exit(
             "Invalid key: must be 1-4096 printable non-space characters",
             code=2,
@@ -112,7 +252,8 @@ def set_memory(
     memory_svc = resolve_memory_service(command, fmt_lower, quiet, verbose, debug)
 
     try:
-        memory_svc.set(key, value)
+        for k, v in pairs:
+            memory_svc.set(k, v)
     except Exception as exc:
         emit_error_and_exit(
             f"Failed to set memory: {exc}",
@@ -125,9 +266,14 @@ def set_memory(
             debug=debug,
         )
 
+    keys = list(dict.fromkeys(k for k, _ in pairs))
     new_run_command(
         command_name=command,
-        payload_builder=lambda include: _build_payload(include, key, value),
+        payload_builder=lambda include: (
+            _build_batch_payload(include, keys)
+            if from_stdin
+            else _build_payload(include, *pairs[0])
+        ),
         quiet=quiet,
         verbose=verbose,
         fmt=fmt_lower,
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2025 Bijan Mousavi
+
+"""Runs Bijux CLI invocations without paying interpreter start-up per call.
+
+`invoke` calls the real `bijux_cli.__main__.main` entry point with `sys.argv`
+patched and the standard streams captured, so argument pre-processing and
+structured error translation match the installed binary.
+
+Executed as ``python -m tests.e2e.cli_worker`` the module becomes a warm
+helper process: it reads one JSON request per line from stdin and answers
+each with one JSON line on its original stdout.
+
+Request:  ``{"args": [str, ...], "env": {str: str}, "input": str | null}``
+Response: ``{"rc": int, "stdout": str, "stderr": str}``
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import importlib.metadata
+import inspect
+import json
+import logging
+import os
+import sys
+from typing import Any, TextIO
+
+import click.exceptions
+import click.testing
+from packaging.version import Version
+import structlog
+
+# Click 8.2 removed ``mix_stderr``; from then on stderr is always captured
+# separately and `CliRunner.isolation` yields a third, combined stream.
+_RUNNER = (
+    click.testing.CliRunner()
+    if Version(importlib.metadata.version("click")) >= Version("8.2")
+    else click.testing.CliRunner(mix_stderr=False)  # pyright: ignore[reportCallIssue]
+)
+
+
+def _run_isolated(
+    target: Callable[[], Any],
+    argv: list[str],
+    env: Mapping[str, str | None] | None,
+    input_data: str | None,
+) -> tuple[int, str, str]:
+    """Run ``target`` with captured streams and patched ``sys.argv``.
+
+    Args:
+        target: The callable to run; its return value is the exit code.
+        argv: The value of ``sys.argv`` while ``target`` runs.
+        env: Environment overrides; a value of None unsets the variable.
+        input_data: Optional string to pass to stdin.
+
+    Returns:
+        A tuple of ``(returncode, stdout, stderr)``.
+    """
+    from bijux_cli.core.di import DIContainer
+
+    host_main = sys.modules["__main__"]
+    with _RUNNER.isolation(input=input_data, env=dict(env or {})) as streams:
+        out, err = streams[0], streams[1]
+        stdout, stderr, saved_argv = sys.stdout, sys.stderr, sys.argv
+        saved_package = getattr(host_main, "__package__", None)
+        sys.argv = argv
+        # Click names the program after ``__main__.__package__`` when it is
+        # set (``python -m pytest``); clear it so usage reads ``bijux``.
+        host_main.__package__ = None
+        try:
+            code: Any = target()
+        except SystemExit as exc:
+            code = exc.code
+        finally:
+            if getattr(sys.stderr, "name", None) == os.devnull:
+                sys.stderr.close()
+            sys.stdout, sys.stderr, sys.argv = stdout, stderr, saved_argv
+            host_main.__package__ = saved_package
+            stdout.flush()
+            stderr.flush()
+            DIContainer._reset_for_tests()  # pyright: ignore[reportPrivateUsage]
+        if code is None:
+            code = 0
+        elif not isinstance(code, int):
+            code = 1
+        return (
+            code,
+            out.getvalue().decode("utf-8", "replace"),
+            err.getvalue().decode("utf-8", "replace"),
+        )
+
+
+def invoke(
+    args: list[str],
+    *,
+    env: Mapping[str, str | None] | None = None,
+    input_data: str | None = None,
+) -> tuple[int, str, str]:
+    """Run one CLI invocation in the current process.
+
+    All calls share one module-level runner and only its stream isolation is
+    used, so no temporary filesystem or ``Result`` is built per call. The
+    dependency-injection container is torn down afterwards so every call
+    starts from the same state as a fresh process. Callers must serialize
+    invocations because argv and the standard streams are process-global.
+
+    Args:
+        args: The command-line arguments, excluding the program name.
+        env: Environment overrides; a value of None unsets the variable.
+        input_data: Optional string to pass to the command's stdin.
+
+    Returns:
+        A tuple of ``(returncode, stdout, stderr)``.
+    """
+    from bijux_cli.__main__ import main
+
+    return _run_isolated(main, ["bijux", *args], env, input_data)
+
+
+def preimport() -> None:
+    """Import the CLI entry point so the first invocation in a worker is warm."""
+    import bijux_cli.__main__  # noqa: F401
+
+
+def reset_logging() -> None:
+    """Return stdlib logging and structlog to their unconfigured state.
+
+    The entry point configures logging with ``logging.basicConfig``, which
+    does nothing once the root logger has handlers, and structlog caches
+    loggers on first use; without a reset, a worker keeps the log level and
+    stream of its first invocation. Only call this in a process that owns
+    its logging setup, because every root handler is removed.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(logging.WARNING)
+    structlog.reset_defaults()
+
+
+def invoke_fresh(
+    args: list[str],
+    *,
+    env: Mapping[str, str | None] | None = None,
+    input_data: str | None = None,
+) -> tuple[int, str, str]:
+    """Run one CLI invocation with logging reset first, as in a new process.
+
+    Args:
+        args: The command-line arguments, excluding the program name.
+        env: Environment overrides; a value of None unsets the variable.
+        input_data: Optional string to pass to the command's stdin.
+
+    Returns:
+        A tuple of ``(returncode, stdout, stderr)``.
+    """
+    reset_logging()
+    return invoke(args, env=env, input_data=input_data)
+
+
+def invoke_callback(
+    func: Callable[..., Any],
+    *args: Any,
+    env: Mapping[str, str | None] | None = None,
+    input_data: str | None = None,
+    **params: Any,
+) -> tuple[int, str, str]:
+    """Call a Typer command callback directly, bypassing argument parsing.
+
+    Parameters not given in ``args`` or ``params`` take the defaults declared
+    by their ``typer.Option``/``typer.Argument``. Only the default services
+    are registered, so the entry point's plugin loading, global-flag
+    pre-processing and history recording are skipped.
+
+    Args:
+        func: The command callback, e.g. `bijux_cli.commands.memory.get.get_memory`.
+        *args: Positional arguments for ``func``.
+        env: Environment overrides; a value of None unsets the variable.
+        input_data: Optional string to pass to stdin.
+        **params: Keyword arguments for ``func``.
+
+    Returns:
+        A tuple of ``(returncode, stdout, stderr)``.
+    """
+    from typer.models import ParameterInfo
+
+    from bijux_cli.__main__ import setup_structlog
+    from bijux_cli.core.di import DIContainer
+    from bijux_cli.core.enums import OutputFormat
+    from bijux_cli.services import register_default_services
+
+    bound = inspect.signature(func).bind_partial(*args, **params)
+    for name, param in inspect.signature(func).parameters.items():
+        if name not in bound.arguments and isinstance(param.default, ParameterInfo):
+            bound.arguments[name] = param.default.default
+
+    def target() -> Any:
+        """Register the default services, then run the callback."""
+        setup_structlog(False)
+        register_default_services(
+            DIContainer.current(),
+            debug=False,
+            output_format=OutputFormat.JSON,
+            quiet=False,
+        )
+        try:
+            return func(*bound.args, **bound.kwargs)
+        except click.exceptions.Exit as exc:
+            return exc.exit_code
+
+    return _run_isolated(target, ["bijux"], env, input_data)
+
+
+def serve(requests: TextIO, responses: TextIO) -> None:
+    """Answer JSON-line invocation requests until ``requests`` is exhausted.
+
+    Each request's ``env`` is the complete environment for that call, so
+    variables absent from it are unset for the duration of the invocation,
+    and logging is reset before every call so that no request inherits the
+    log level or stream configured by an earlier one.
+
+    Args:
+        requests: The stream to read JSON request lines from.
+        responses: The stream to write JSON response lines to.
+    """
+    for line in requests:
+        if not line.strip():
+            continue
+        req = json.loads(line)
+        env: dict[str, str | None] = dict.fromkeys(os.environ)
+        env.update(req.get("env") or {})
+        rc, out, err = invoke_fresh(req["args"], env=env, input_data=req.get("input"))
+        responses.write(json.dumps({"rc": rc, "stdout": out, "stderr": err}) + "\n")
+        responses.flush()
+
+
+def _main() -> None:
+    """Serve requests on stdin, keeping stray fd-level writes off the protocol."""
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    serve(sys.stdin, protocol)
+
+
+if __name__ == "__main__":
+    _main()
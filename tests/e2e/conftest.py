@@ -5,28 +5,63 @@
 
 Tests invoke the built CLI binary via subprocess, simulating real user interactions
 with the installed wheel file, covering all commands, options, and edge cases.
+
+Modules or tests marked ``in_process`` route `run_cli` through the real
+`bijux_cli.__main__.main` entry point inside the test process instead, and
+``warm_process`` routes it through one long-lived helper process per session;
+both skip per-call interpreter start-up. ``subprocess`` forces a fresh child
+process again for tests that need signals or process-level isolation.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+import importlib.util
 import json
 import os
 from pathlib import Path
 import re
+import select
 import shlex
 import shutil
-from subprocess import CompletedProcess, TimeoutExpired, run
+from subprocess import DEVNULL, PIPE, CompletedProcess, Popen, TimeoutExpired, run
 import sys
-from typing import Any, cast
+import tempfile
+import threading
+from typing import IO, Any, cast
 
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+import orjson
 import pexpect  # type: ignore[import-untyped]
 import pytest
 import yaml  # pyright: ignore[reportMissingModuleSource]
 
+import bijux_cli.__main__  # noqa: F401  # pay the CLI's import cost once, at collection
+from tests.e2e import cli_worker
+
 ROOT = Path(__file__).resolve().parent.parent.parent
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 _ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
 
+settings.register_profile(
+    "dev",
+    max_examples=3,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+# CI replays its cached example database first and skips shrinking.
+settings.register_profile(
+    "ci",
+    settings.get_profile("dev"),
+    max_examples=10,
+    database=DirectoryBasedExampleDatabase(".hypothesis/ci"),
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile("nightly", settings.get_profile("dev"), max_examples=50)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
 
 def find_bijux_binary() -> Path:
     """Locate the bijux executable for end-to-end tests.
@@ -81,6 +116,130 @@ _fallback_cmd = [sys.executable, "-m", "bijux_cli"] if _bin is None else [str(_b
 
 _repo_root = Path(__file__).resolve().parents[2]
 
+_in_process_lock = threading.Lock()
+
+
+class _CliRoute:
+    """How `run_cli` launches the CLI for the currently running test."""
+
+    in_process: bool = False
+    worker: CliWorker | None = None
+    pycache_prefix: str | None = None
+
+
+@pytest.fixture(scope="session")
+def _pycache_prefix(  # pyright: ignore[reportUnusedFunction]
+    tmp_path_factory: pytest.TempPathFactory,
+) -> str:
+    """Compile a private bytecode cache for spawned CLI processes.
+
+    `bijux_cli` is byte-compiled once into a session-private directory and a
+    single warm-up import fills in the rest of the CLI's import closure, so
+    each child pointed at it through ``PYTHONPYCACHEPREFIX`` loads ``.pyc``
+    files instead of parsing source, even when the installed tree has no
+    usable ``__pycache__``. Only the subprocess route of `run_cli` and
+    `bijux_bin` request it; runs that never spawn the CLI skip the work.
+
+    Args:
+        tmp_path_factory: The pytest `tmp_path_factory` fixture.
+
+    Returns:
+        The directory to use as ``PYTHONPYCACHEPREFIX``.
+    """
+    prefix = str(tmp_path_factory.mktemp("pyc"))
+    env = _pycache_env(prefix, os.environ)
+    spec = importlib.util.find_spec("bijux_cli")
+    if spec is not None and spec.submodule_search_locations:
+        run(  # noqa: S603
+            [sys.executable, "-m", "compileall", "-j0", "-q"]
+            + list(spec.submodule_search_locations),
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            env=env,
+            check=False,
+        )
+    run(  # noqa: S603
+        [sys.executable, "-c", "import bijux_cli.__main__"],
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        env=env,
+        check=False,
+    )
+    return prefix
+
+
+def _pycache_env(prefix: str, env: Mapping[str, str]) -> dict[str, str]:
+    """Return a copy of ``env`` that reads and writes the cache at ``prefix``.
+
+    Bytecode writing is re-enabled because the cache is private to the
+    session; modules it still lacks are then compiled only once.
+
+    Args:
+        prefix: The directory returned by the `_pycache_prefix` fixture.
+        env: The environment to copy.
+
+    Returns:
+        The child environment.
+    """
+    child = dict(env)
+    child["PYTHONPYCACHEPREFIX"] = prefix
+    child.pop("PYTHONDONTWRITEBYTECODE", None)
+    return child
+
+
+@contextmanager
+def cli_route(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Route `run_cli` according to the markers on ``request.node``.
+
+    Nodes carrying the ``in_process`` marker run the CLI in-process and nodes
+    carrying ``warm_process`` use the session's warm helper process, unless
+    they are also marked ``subprocess``; all others spawn a fresh process.
+    Module-scoped fixtures use this directly so that their calls follow the
+    module's ``pytestmark`` rather than the per-test default.
+
+    Args:
+        request: The pytest `request` fixture of the test or fixture.
+
+    Yields:
+        None: Yields control with the route selected; the previous route is
+            restored afterwards.
+    """
+    saved = (_CliRoute.in_process, _CliRoute.worker, _CliRoute.pycache_prefix)
+    node = request.node
+    if not node.get_closest_marker("subprocess"):
+        if node.get_closest_marker("in_process"):
+            _CliRoute.in_process = True
+        elif node.get_closest_marker("warm_process"):
+            _CliRoute.worker = request.getfixturevalue("warm_cli")
+    if not _CliRoute.in_process and _CliRoute.worker is None:
+        _CliRoute.pycache_prefix = request.getfixturevalue("_pycache_prefix")
+    try:
+        yield
+    finally:
+        (
+            _CliRoute.in_process,
+            _CliRoute.worker,
+            _CliRoute.pycache_prefix,
+        ) = saved
+
+
+@pytest.fixture(autouse=True)
+def _select_cli_runner(  # pyright: ignore[reportUnusedFunction]
+    request: pytest.FixtureRequest,
+) -> Generator[None, None, None]:
+    """Select how `run_cli` launches the CLI for the current test.
+
+    See `cli_route` for how the markers map to a launcher.
+
+    Args:
+        request: The pytest `request` fixture for the running test.
+
+    Yields:
+        None: Yields control to the test function.
+    """
+    with cli_route(request):
+        yield
+
 
 def _unique_pathlist(*segments: str) -> str:
     """Create a unique, ordered, path-separated string from segments.
@@ -123,13 +282,24 @@ def run_cli(
     Returns:
         A `subprocess.CompletedProcess` instance containing the results.
         If a timeout occurs, a `CompletedProcess` is still returned with a
-        return code of 124.
+        return code of 124. Tests marked ``in_process`` are dispatched to
+        `run_cli_in_process`, where ``timeout`` is not enforced, and tests
+        marked ``warm_process`` to the session's `CliWorker`.
     """
     if isinstance(args, str):
         args = shlex.split(args)
 
+    if _CliRoute.in_process:
+        return run_cli_in_process(args, env=env, input_data=input_data)
+    if _CliRoute.worker is not None:
+        return _CliRoute.worker.run(
+            args, env=env, input_data=input_data, timeout=timeout
+        )
+
     merged = os.environ.copy()
     merged.update(env or {})
+    if _CliRoute.pycache_prefix is not None:
+        merged = _pycache_env(_CliRoute.pycache_prefix, merged)
 
     merged["PYTHONIOENCODING"] = "utf-8"
     merged["BIJUXCLI_TEST_MODE"] = "1"
@@ -171,6 +341,273 @@ def run_cli(
         )
 
 
+def run_cli_in_process(
+    args: list[str] | str,
+    *,
+    env: dict[str, str] | None = None,
+    input_data: str | None = None,
+) -> CompletedProcess[str]:
+    """Run the Bijux CLI entry point inside the test process.
+
+    Delegates to `tests.e2e.cli_worker.invoke`, serializing calls because
+    argv and the standard streams are process-global.
+
+    Args:
+        args: A list of command-line arguments or a single shell-style string.
+        env: An optional dictionary of environment variables to set.
+        input_data: Optional string to pass to the command's stdin.
+
+    Returns:
+        A `subprocess.CompletedProcess` instance containing the results.
+    """
+    if isinstance(args, str):
+        args = shlex.split(args)
+
+    overrides: dict[str, str | None] = {
+        **(env or {}),
+        "BIJUXCLI_TEST_MODE": "1",
+        "VERBOSE_DI": None,
+    }
+    with _in_process_lock:
+        code, stdout, stderr = cli_worker.invoke(
+            args, env=overrides, input_data=input_data
+        )
+    return CompletedProcess(["bijux", *args], code, stdout, stderr)
+
+
+def call_direct(
+    func: Callable[..., Any],
+    *args: Any,
+    env: dict[str, str] | None = None,
+    input_data: str | None = None,
+    **params: Any,
+) -> CompletedProcess[str]:
+    """Call a command callback in-process without parsing a command line.
+
+    Use this for happy-path checks of a command's behaviour; tests that are
+    about argument parsing, flag handling or error translation belong on
+    `run_cli`, which goes through the real entry point.
+
+    Args:
+        func: The Typer command callback to call.
+        *args: Positional arguments for ``func``.
+        env: An optional dictionary of environment variables to set.
+        input_data: Optional string to pass to the command's stdin.
+        **params: Keyword arguments for ``func``; omitted options take their
+            declared defaults.
+
+    Returns:
+        A `subprocess.CompletedProcess` instance containing the results.
+    """
+    overrides: dict[str, str | None] = {
+        **(env or {}),
+        "BIJUXCLI_TEST_MODE": "1",
+        "VERBOSE_DI": None,
+    }
+    with _in_process_lock:
+        code, stdout, stderr = cli_worker.invoke_callback(
+            func, *args, env=overrides, input_data=input_data, **params
+        )
+    return CompletedProcess([func.__name__, *map(str, args)], code, stdout, stderr)
+
+
+class CliWorker:
+    """A warm helper process that runs CLI invocations sent over a pipe.
+
+    The process (`tests.e2e.cli_worker`) is started lazily and reused across
+    calls, so only the first invocation pays interpreter start-up and import
+    cost. A timed-out invocation kills the process; the next call respawns it.
+    The process's stderr goes to a temporary file so that it can be reported
+    if the process dies mid-call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the worker handle without starting the process."""
+        self._proc: Popen[str] | None = None
+        self._stderr: IO[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> Popen[str]:
+        """Start the helper process if it is not running.
+
+        Returns:
+            The running helper process.
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self.close()
+            self._stderr = tempfile.TemporaryFile()  # noqa: SIM115
+            env = os.environ.copy()
+            env["PYTHONPATH"] = _unique_pathlist(
+                str(_repo_root), env.get("PYTHONPATH", "")
+            )
+            self._proc = Popen(  # noqa: S603
+                [sys.executable, "-m", "tests.e2e.cli_worker"],
+                stdin=PIPE,
+                stdout=PIPE,
+                stderr=self._stderr,
+                text=True,
+                encoding="utf-8",
+                env=env,
+                cwd=_repo_root,
+            )
+        return self._proc
+
+    def run(
+        self,
+        args: list[str] | str,
+        *,
+        env: dict[str, str] | None = None,
+        input_data: str | None = None,
+        timeout: int = 10,
+    ) -> CompletedProcess[str]:
+        """Run one CLI invocation in the helper process.
+
+        Args:
+            args: A list of command-line arguments or a single shell-style string.
+            env: An optional dictionary of environment variables to set.
+            input_data: Optional string to pass to the command's stdin.
+            timeout: The timeout in seconds for the invocation.
+
+        Returns:
+            A `subprocess.CompletedProcess` instance containing the results,
+            with a return code of 124 if the invocation timed out.
+
+        Raises:
+            RuntimeError: If the helper process exits without answering.
+        """
+        if isinstance(args, str):
+            args = shlex.split(args)
+
+        merged = os.environ.copy()
+        merged.update(env or {})
+        merged["PYTHONIOENCODING"] = "utf-8"
+        merged["BIJUXCLI_TEST_MODE"] = "1"
+        merged["BIJUXCLI_BIN"] = _fallback_cmd[0]
+        merged.pop("VERBOSE_DI", None)
+        request = json.dumps({"args": args, "env": merged, "input": input_data})
+
+        cmd = ["bijux", *args]
+        with self._lock:
+            proc = self._ensure_started()
+            assert proc.stdin is not None
+            assert proc.stdout is not None
+            proc.stdin.write(request + "\n")
+            proc.stdin.flush()
+            ready, _, _ = select.select([proc.stdout], [], [], timeout)
+            if not ready:
+                self.close()
+                return CompletedProcess(cmd, 124, "", f"\n[TIMEOUT after {timeout}s]")
+            line = proc.stdout.readline()
+            if not line:
+                raise self._died(proc)
+            reply = json.loads(line)
+        return CompletedProcess(cmd, reply["rc"], reply["stdout"], reply["stderr"])
+
+    def _died(self, proc: Popen[str]) -> RuntimeError:
+        """Describe a helper process that exited mid-call, then clean it up.
+
+        Args:
+            proc: The helper process that closed its response pipe.
+
+        Returns:
+            An error carrying the process's return code and stderr.
+        """
+        returncode = proc.wait()
+        stderr = ""
+        if self._stderr is not None:
+            self._stderr.seek(0)
+            stderr = self._stderr.read().decode("utf-8", "replace")
+        self.close()
+        return RuntimeError(
+            f"CLI worker exited with code {returncode} without answering; "
+            f"stderr:\n{stderr}"
+        )
+
+    def close(self) -> None:
+        """Stop the helper process if it is running."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+
+@pytest.fixture
+def bijux_bin(
+    _pycache_prefix: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> str:
+    """Provide the path of the `bijux` executable for tests that spawn it.
+
+    For the duration of the test, ``os.environ`` points children at the
+    session's private bytecode cache; the environment is restored afterwards.
+
+    Args:
+        _pycache_prefix: The `_pycache_prefix` fixture.
+        monkeypatch: The pytest `monkeypatch` fixture.
+
+    Returns:
+        The path to the binary located by `find_bijux_binary`.
+    """
+    monkeypatch.setenv("PYTHONPYCACHEPREFIX", _pycache_prefix)
+    monkeypatch.delenv("PYTHONDONTWRITEBYTECODE", raising=False)
+    return str(BIN)
+
+
+@pytest.fixture(scope="session")
+def warm_cli() -> Generator[CliWorker, None, None]:
+    """Provide one warm CLI helper process per test session (or xdist worker).
+
+    Yields:
+        The shared `CliWorker` instance.
+    """
+    worker = CliWorker()
+    yield worker
+    worker.close()
+
+
+@pytest.fixture(scope="session")
+def warm_cli_pool() -> Generator[list[CliWorker], None, None]:
+    """Provide a small pool of warm CLI helper processes per session.
+
+    Each `CliWorker` serializes its own calls, so tests that invoke the CLI
+    from several threads dispatch round-robin over the pool instead.
+
+    Yields:
+        The shared list of `CliWorker` instances.
+    """
+    pool = [CliWorker() for _ in range(4)]
+    yield pool
+    for worker in pool:
+        worker.close()
+
+
+def json_loads(text: str | bytes) -> Any:
+    """Parse JSON CLI output with `orjson`.
+
+    Args:
+        text: The JSON document to parse.
+
+    Returns:
+        The parsed value.
+    """
+    return orjson.loads(text)
+
+
+def yaml_loads(text: str) -> Any:
+    """Parse YAML CLI output, using the libyaml-backed loader when available.
+
+    Args:
+        text: The YAML document to parse.
+
+    Returns:
+        The parsed value.
+    """
+    return yaml.load(text, Loader=_YAML_LOADER)  # noqa: S506
+
+
 def _decolorise(text: str) -> str:
     """Remove ANSI color and style escape codes from a string.
 
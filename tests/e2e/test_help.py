@@ -9,7 +9,7 @@ import json
 import re
 from typing import Any, cast
 
-from hypothesis import HealthCheck, assume, given, settings
+from hypothesis import HealthCheck, Phase, assume, given, settings
 from hypothesis import strategies as st
 import pytest
 import yaml
@@ -17,6 +17,8 @@ import yaml
 from tests.e2e.conftest import run_cli
 
 KNOWN_FLAGS = ["--help", "--format", "--pretty", "--no-pretty", "--quiet", "-v", "-d"]
+_LEAK_RE = re.compile(r"traceback|typer|click", re.IGNORECASE)
+_NO_SHRINK = (Phase.explicit, Phase.reuse, Phase.generate)
 
 
 def _normalize(text: str) -> str:
@@ -40,10 +42,8 @@ def assert_yaml_obj(text: str) -> dict[str, Any]:
 
 def assert_no_framework_leak(text: str) -> None:
     """Ensure output contains no stacktraces, Typer, or Click names."""
-    lowered = text.lower()
-    assert "traceback" not in lowered
-    assert "typer" not in lowered
-    assert "click" not in lowered
+    leak = _LEAK_RE.search(text)
+    assert leak is None, f"Leaked {leak.group(0)!r} in output: {text!r}"
 
 
 @pytest.mark.parametrize(
@@ -153,7 +153,10 @@ def test_help_nonascii_env(monkeypatch: Any) -> None:
     )
 )
 @settings(
-    max_examples=10, deadline=None, suppress_health_check=[HealthCheck.filter_too_much]
+    max_examples=10,
+    deadline=None,
+    phases=_NO_SHRINK,
+    suppress_health_check=[HealthCheck.filter_too_much],
 )
 def test_help_unicode_garbage_command(name: str) -> None:
     """Test that non-ASCII command names are handled."""
@@ -269,7 +272,12 @@ def test_adr_format_errors_and_contract(argv: list[str], expected_msg: str) -> N
     ),
     value=st.one_of(st.just("json"), st.just("yaml"), st.just("bogus"), st.none()),
 )
-@settings(suppress_health_check=[HealthCheck.too_slow], max_examples=50, deadline=None)
+@settings(
+    suppress_health_check=[HealthCheck.too_slow],
+    max_examples=50,
+    deadline=None,
+    phases=_NO_SHRINK,
+)
 def test_help_fuzz_flags(flags: list[str], value: str | None) -> None:
     """Fuzz various flag combinations for the help command, respecting ADR."""
     args: list[str] = []
@@ -5,26 +5,123 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from asyncio.subprocess import Process
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
+import re
 import signal
-from subprocess import PIPE, Popen
-import sys
-import threading
-import time
-from typing import Any
+from subprocess import DEVNULL, PIPE, CompletedProcess
 
 import pytest
-import yaml  # pyright: ignore[reportMissingModuleSource]
+import pytest_asyncio
 
-from .conftest import run_cli
+from bijux_cli.commands.memory.clear import clear_memory
+from bijux_cli.commands.memory.delete import delete_memory
+from bijux_cli.commands.memory.get import get_memory
+from bijux_cli.commands.memory.list import list_memory
+from bijux_cli.commands.memory.set import set_memory
+from bijux_cli.services.memory import Memory
+
+from .conftest import BIN, call_direct, json_loads, run_cli, yaml_loads
+
+pytestmark = pytest.mark.in_process
+
+_HELP_FLAGS = frozenset(
+    {
+        "-q",
+        "--quiet",
+        "-v",
+        "--verbose",
+        "-f",
+        "--format",
+        "--pretty",
+        "--no-pretty",
+        "-d",
+        "--debug",
+    }
+)
+_FLAG_RE = re.compile(
+    r"--?(?:q(?:uiet)?|v(?:erbose)?|f(?:ormat)?|d(?:ebug)?|pretty|no-pretty)"
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def memory_children(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncGenerator[dict[str, Process], None]:
+    """Spawn every child process the module's subprocess tests need at once.
+
+    The children start concurrently on the module's event loop, so their
+    interpreter start-up overlaps instead of being paid once per test; each
+    test then only reaps its own child.
+
+    Args:
+        tmp_path_factory: The pytest `tmp_path_factory` fixture.
+
+    Yields:
+        The running children, keyed by the test that consumes them.
+    """
+    home = tmp_path_factory.mktemp("memory-children")
+    env = {**os.environ, "HOME": str(home), "BIJUXCLI_TEST_MODE": "1"}
+    cli = [str(BIN), "memory"]
+    sigint, ascii_env = await asyncio.gather(
+        asyncio.create_subprocess_exec(
+            *cli,
+            "set",
+            "--stdin",
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+            env={**env, "BIJUXCLI_READY_SENTINEL": "1"},
+        ),
+        asyncio.create_subprocess_exec(
+            *cli,
+            stdin=DEVNULL,
+            stdout=PIPE,
+            stderr=PIPE,
+            env={**env, "BIJUXCLI_CONFIG": "/tmp/\u2603"},  # noqa: S108
+        ),
+    )
+    children = {"sigint": sigint, "ascii": ascii_env}
+    yield children
+    for proc in children.values():
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+def _assert_not_found(res: CompletedProcess[str]) -> None:
+    """Assert that ``res`` is the structured "key not found" error.
+
+    Args:
+        res: The result of a memory command that looked up a missing key.
+    """
+    assert res.returncode == 1
+    payload = json_loads(res.stderr or res.stdout)
+    assert (payload["code"], payload["failure"]) == (1, "not_found"), payload
+
+
+@pytest.fixture(autouse=True)
+def _empty_store(  # pyright: ignore[reportUnusedFunction]
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Give every test its own empty memory store under a private home."""
+    bijux_home = tmp_path / ".bijux"
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("BIJUXCLI_CONFIG", str(bijux_home / ".env"))
+    monkeypatch.setattr(
+        "bijux_cli.services.memory.MEMORY_FILE", bijux_home / ".memory.json"
+    )
 
 
 def test_e2e_memory_status_json() -> None:
     """Test the root 'memory' command with default JSON output."""
     res = run_cli(["memory"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert data["status"] == "ok"
 
 
@@ -32,7 +129,7 @@ def test_e2e_memory_status_yaml() -> None:
     """Test the root 'memory' command with YAML output."""
     res = run_cli(["memory", "--format", "yaml"])
     assert res.returncode == 0
-    data = yaml.safe_load(res.stdout)
+    data = yaml_loads(res.stdout)
     assert data["status"] == "ok"
     assert "message" in data
 
@@ -46,39 +143,74 @@ def test_e2e_memory_status_debug() -> None:
 
 def test_e2e_memory_set_and_get() -> None:
     """Test setting and then getting a value."""
-    res1 = run_cli(["memory", "set", "foo", "bar"])
+    res1 = call_direct(set_memory, "foo", "bar")
     assert res1.returncode == 0
-    res2 = run_cli(["memory", "get", "foo"])
+    res2 = call_direct(get_memory, "foo")
     assert res2.returncode == 0
-    data = json.loads(res2.stdout)
+    data = json_loads(res2.stdout)
     assert data["value"] == "bar"
 
 
+@pytest.mark.parametrize(
+    ("setup", "key", "value"),
+    [
+        ([], "emptykey", ""),
+        ([("overwrite", "first")], "overwrite", "second"),
+        ([], "üñîçødë", "✓"),
+        ([], "bigkey", "x" * 10_000),
+        ([], "!@#$%^&*()", "val"),
+        ([], "specialval", "!@#$%^&*()_+-={}[]:\";'<>?,./"),
+        ([], "multiline", "line1\nline2\nline3"),
+        ([], "k" * 2048, "v"),
+        ([], "nonekey", "None"),
+    ],
+    ids=[
+        "empty-value",
+        "overwrite",
+        "unicode",
+        "large-value",
+        "special-chars-key",
+        "special-chars-value",
+        "multiline-value",
+        "large-key",
+        "none-literal",
+    ],
+)
+def test_e2e_memory_set_then_get_roundtrip(
+    setup: list[tuple[str, str]], key: str, value: str
+) -> None:
+    """Test that a value set under a key is returned verbatim by `get`."""
+    for k, v in setup:
+        call_direct(set_memory, k, v)
+    res = call_direct(set_memory, key, value)
+    assert res.returncode == 0
+    getres = call_direct(get_memory, key)
+    assert json_loads(getres.stdout)["value"] == value
+
+
 def test_e2e_memory_set_and_get_yaml() -> None:
     """Test setting and getting a value with YAML format."""
     res1 = run_cli(["memory", "set", "ykey", "yval", "--format", "yaml"])
     assert res1.returncode == 0
     res2 = run_cli(["memory", "get", "ykey", "--format", "yaml"])
     assert res2.returncode == 0
-    data = yaml.safe_load(res2.stdout)
+    data = yaml_loads(res2.stdout)
     assert data["value"] == "yval"
 
 
 def test_e2e_memory_get_nonexistent() -> None:
     """Test that getting a non-existent key fails gracefully."""
-    res = run_cli(["memory", "get", "notfound"])
-    assert res.returncode != 0 or "null" in res.stdout or "None" in res.stdout
+    res = call_direct(get_memory, "notfound")
+    _assert_not_found(res)
 
 
 def test_e2e_memory_clear_and_get() -> None:
     """Test getting a key after the memory has been cleared."""
-    run_cli(["memory", "set", "to_be_cleared", "gone"])
-    res_clear = run_cli(["memory", "clear"])
+    call_direct(set_memory, "to_be_cleared", "gone")
+    res_clear = call_direct(clear_memory)
     assert res_clear.returncode == 0
-    res_get = run_cli(["memory", "get", "to_be_cleared"])
-    assert (
-        res_get.returncode != 0 or "null" in res_get.stdout or "None" in res_get.stdout
-    )
+    res_get = call_direct(get_memory, "to_be_cleared")
+    _assert_not_found(res_get)
 
 
 def test_e2e_memory_set_debug_mode() -> None:
@@ -92,15 +224,9 @@ def test_e2e_memory_set_debug_mode() -> None:
 def test_e2e_memory_set_invalid_format() -> None:
     """Test that using an invalid format fails."""
     res = run_cli(["memory", "set", "fkey", "fval", "--format", "invalid"])
-    assert res.returncode != 0
-    msg = (res.stdout or "") + (res.stderr or "")
-    msg = msg.lower()
-    assert (
-        "unsupported format" in msg
-        or "not a valid" in msg
-        or "invalid format" in msg
-        or "invalid" in msg
-    ), msg
+    assert res.returncode == 2
+    payload = json_loads(res.stdout or res.stderr)
+    assert (payload["code"], payload["failure"]) == (2, "format"), payload
 
 
 def test_e2e_memory_quiet_mode_suppresses_output() -> None:
@@ -110,85 +236,39 @@ def test_e2e_memory_quiet_mode_suppresses_output() -> None:
     assert res.stdout.strip() == "" or res.stdout.strip() == "{}"
 
 
-def test_e2e_memory_set_empty_value() -> None:
-    """Test setting a key to an empty string value."""
-    res = run_cli(["memory", "set", "emptykey", ""])
-    assert res.returncode == 0
-    getres = run_cli(["memory", "get", "emptykey"])
-    data = json.loads(getres.stdout)
-    assert data["value"] == ""
-
-
-def test_e2e_memory_overwrite_value() -> None:
-    """Test that setting an existing key overwrites its value."""
-    run_cli(["memory", "set", "overwrite", "first"])
-    run_cli(["memory", "set", "overwrite", "second"])
-    res = run_cli(["memory", "get", "overwrite"])
-    data = json.loads(res.stdout)
-    assert data["value"] == "second"
-
-
 def test_e2e_memory_delete_key() -> None:
     """Test deleting a key."""
-    run_cli(["memory", "set", "delkey", "toremove"])
-    delres = run_cli(["memory", "delete", "delkey"])
+    call_direct(set_memory, "delkey", "toremove")
+    delres = call_direct(delete_memory, "delkey")
     assert delres.returncode == 0
-    getres = run_cli(["memory", "get", "delkey"])
-    assert getres.returncode != 0 or "null" in getres.stdout or "None" in getres.stdout
+    getres = call_direct(get_memory, "delkey")
+    _assert_not_found(getres)
 
 
 def test_e2e_memory_list_keys() -> None:
     """Test listing all stored keys."""
-    run_cli(["memory", "set", "key1", "val1"])
-    run_cli(["memory", "set", "key2", "val2"])
+    run_cli(["memory", "set", "--stdin"], input_data="key1=val1\nkey2=val2\n")
     res = run_cli(["memory", "list", "--format", "json"])
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert "key1" in data["keys"]
     assert "key2" in data["keys"]
 
 
 def test_e2e_memory_list_empty() -> None:
     """Test listing keys when the store is empty."""
-    run_cli(["memory", "clear"])
-    res = run_cli(["memory", "list", "--format", "json"])
-    data = json.loads(res.stdout)
+    res = call_direct(list_memory)
+    data = json_loads(res.stdout)
     assert data["keys"] == []
 
 
-def test_e2e_memory_set_unicode_key_value() -> None:
-    """Test setting and getting a key and value with unicode characters."""
-    res = run_cli(["memory", "set", "üñîçødë", "✓"])
-    assert res.returncode == 0
-    getres = run_cli(["memory", "get", "üñîçødë"])
-    data = json.loads(getres.stdout)
-    assert data["value"] == "✓"
-
-
-def test_e2e_memory_set_large_value() -> None:
-    """Test setting and getting a very large value."""
-    large = "x" * 10_000
-    res = run_cli(["memory", "set", "bigkey", large])
-    assert res.returncode == 0
-    getres = run_cli(["memory", "get", "bigkey"])
-    data = json.loads(getres.stdout)
-    assert data["value"] == large
-
-
-def test_e2e_memory_concurrent_set_and_get(tmp_path: Path) -> None:
-    """Test concurrent read and write operations."""
-
-    def set_key(val: str) -> None:
-        """Executes the CLI command to set the 'conc' key to a given value."""
-        run_cli(["memory", "set", "conc", val])
-
-    threads = [threading.Thread(target=set_key, args=(str(i),)) for i in range(5)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+def test_e2e_memory_concurrent_set_and_get() -> None:
+    """Test concurrent writes to a shared store, then read back via the CLI."""
+    store = Memory()
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        list(pool.map(lambda i: store.set("conc", str(i)), range(5)))
     res = run_cli(["memory", "get", "conc"])
     assert res.returncode == 0
-    val = json.loads(res.stdout)["value"]
+    val = json_loads(res.stdout)["value"]
     assert val in {str(i) for i in range(5)}
 
 
@@ -204,104 +284,69 @@ def test_e2e_memory_list_yaml_format() -> None:
     run_cli(["memory", "set", "ky", "vl"])
     res = run_cli(["memory", "list", "--format", "yaml"])
     assert res.returncode == 0
-    data = yaml.safe_load(res.stdout)
+    data = yaml_loads(res.stdout)
     assert "ky" in data["keys"]
 
 
 def test_e2e_memory_delete_nonexistent_key() -> None:
     """Test that deleting a non-existent key fails."""
-    res = run_cli(["memory", "delete", "does_not_exist"])
-    assert res.returncode != 0
-    assert "not found" in res.stderr.lower() or "error" in res.stderr.lower()
+    res = call_direct(delete_memory, "does_not_exist")
+    _assert_not_found(res)
 
 
 def test_e2e_memory_list_after_delete() -> None:
     """Test that a deleted key does not appear when listing keys."""
-    run_cli(["memory", "set", "foo1", "bar1"])
-    run_cli(["memory", "delete", "foo1"])
-    res = run_cli(["memory", "list"])
-    data = json.loads(res.stdout)
+    call_direct(set_memory, "foo1", "bar1")
+    call_direct(delete_memory, "foo1")
+    res = call_direct(list_memory)
+    data = json_loads(res.stdout)
     assert "foo1" not in data["keys"]
 
 
 def test_e2e_memory_set_and_get_multiple_keys() -> None:
     """Test setting and getting multiple keys in sequence."""
     pairs = [("a", "1"), ("b", "2"), ("c", "3")]
+    batch = "".join(f"{k}={v}\n" for k, v in pairs)
+    res = run_cli(["memory", "set", "--stdin"], input_data=batch)
+    assert json_loads(res.stdout)["count"] == len(pairs)
     for k, v in pairs:
-        run_cli(["memory", "set", k, v])
-    for k, v in pairs:
-        res = run_cli(["memory", "get", k])
-        assert json.loads(res.stdout)["value"] == v
+        res = call_direct(get_memory, k)
+        assert json_loads(res.stdout)["value"] == v
 
 
 def test_e2e_memory_delete_then_set_again() -> None:
     """Test that a key can be set again after being deleted."""
-    run_cli(["memory", "set", "x", "y"])
-    run_cli(["memory", "delete", "x"])
-    res1 = run_cli(["memory", "set", "x", "z"])
+    call_direct(set_memory, "x", "y")
+    call_direct(delete_memory, "x")
+    res1 = call_direct(set_memory, "x", "z")
     assert res1.returncode == 0
-    res2 = run_cli(["memory", "get", "x"])
-    assert json.loads(res2.stdout)["value"] == "z"
-
-
-def test_e2e_memory_set_special_chars_key() -> None:
-    """Test setting and getting a key with special characters."""
-    res = run_cli(["memory", "set", "!@#$%^&*()", "val"])
-    assert res.returncode == 0
-    getres = run_cli(["memory", "get", "!@#$%^&*()"])
-    assert json.loads(getres.stdout)["value"] == "val"
-
-
-def test_e2e_memory_set_special_chars_value() -> None:
-    """Test setting and getting a value with special characters."""
-    value = "!@#$%^&*()_+-={}[]:\";'<>?,./"
-    run_cli(["memory", "set", "specialval", value])
-    res = run_cli(["memory", "get", "specialval"])
-    assert json.loads(res.stdout)["value"] == value
-
-
-def test_e2e_memory_set_multiline_value() -> None:
-    """Test setting and getting a multiline value."""
-    val = "line1\nline2\nline3"
-    run_cli(["memory", "set", "multiline", val])
-    res = run_cli(["memory", "get", "multiline"])
-    assert json.loads(res.stdout)["value"] == val
+    res2 = call_direct(get_memory, "x")
+    assert json_loads(res2.stdout)["value"] == "z"
 
 
 def test_e2e_memory_list_returns_all_keys_after_clear_and_set() -> None:
     """Test that list shows all keys after a clear and set cycle."""
-    run_cli(["memory", "clear"])
     keys = ["one", "two", "three"]
-    for k in keys:
-        run_cli(["memory", "set", k, "x"])
+    run_cli(["memory", "set", "--stdin"], input_data="".join(f"{k}=x\n" for k in keys))
     res = run_cli(["memory", "list"])
-    d = json.loads(res.stdout)
+    d = json_loads(res.stdout)
     for k in keys:
         assert k in d["keys"]
 
 
-def test_e2e_memory_set_large_key() -> None:
-    """Test setting and getting a very large key."""
-    key = "k" * 2048
-    run_cli(["memory", "set", key, "v"])
-    res = run_cli(["memory", "get", key])
-    assert json.loads(res.stdout)["value"] == "v"
-
-
 def test_e2e_memory_set_and_delete_large_key() -> None:
     """Test setting and then deleting a very large key."""
     key = "k" * 2048
-    run_cli(["memory", "set", key, "v"])
-    run_cli(["memory", "delete", key])
-    res = run_cli(["memory", "get", key])
-    assert res.returncode != 0 or "null" in res.stdout
+    call_direct(set_memory, key, "v")
+    call_direct(delete_memory, key)
+    res = call_direct(get_memory, key)
+    _assert_not_found(res)
 
 
 def test_e2e_memory_list_with_no_keys_is_empty() -> None:
     """Test that listing an empty store returns an empty list of keys."""
-    run_cli(["memory", "clear"])
-    res = run_cli(["memory", "list"])
-    data = json.loads(res.stdout)
+    res = call_direct(list_memory)
+    data = json_loads(res.stdout)
     assert data["keys"] == []
 
 
@@ -310,16 +355,16 @@ def test_e2e_memory_clear_twice_is_idempotent() -> None:
     run_cli(["memory", "clear"])
     res = run_cli(["memory", "clear"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert "cleared" in data["status"] or "cleared" in data.get("message", "")
 
 
 def test_e2e_memory_set_then_clear_and_get_returns_none() -> None:
     """Test getting a key after it has been cleared."""
-    run_cli(["memory", "set", "will_clear", "gone"])
-    run_cli(["memory", "clear"])
-    res = run_cli(["memory", "get", "will_clear"])
-    assert res.returncode != 0 or "null" in res.stdout or "None" in res.stdout
+    call_direct(set_memory, "will_clear", "gone")
+    call_direct(clear_memory)
+    res = call_direct(get_memory, "will_clear")
+    _assert_not_found(res)
 
 
 def test_e2e_memory_get_with_quiet_returns_nothing() -> None:
@@ -338,12 +383,12 @@ def test_e2e_memory_list_with_debug_prints_keys() -> None:
 
 def test_e2e_memory_set_and_get_case_sensitive() -> None:
     """Test that keys are case-sensitive."""
-    run_cli(["memory", "set", "CaseKey", "UPPER"])
-    run_cli(["memory", "set", "casekey", "lower"])
-    up = run_cli(["memory", "get", "CaseKey"])
-    lo = run_cli(["memory", "get", "casekey"])
-    assert json.loads(up.stdout)["value"] == "UPPER"
-    assert json.loads(lo.stdout)["value"] == "lower"
+    call_direct(set_memory, "CaseKey", "UPPER")
+    call_direct(set_memory, "casekey", "lower")
+    up = call_direct(get_memory, "CaseKey")
+    lo = call_direct(get_memory, "casekey")
+    assert json_loads(up.stdout)["value"] == "UPPER"
+    assert json_loads(lo.stdout)["value"] == "lower"
 
 
 def test_e2e_memory_set_empty_key_fails() -> None:
@@ -352,24 +397,16 @@ def test_e2e_memory_set_empty_key_fails() -> None:
     assert res.returncode != 0
 
 
-def test_e2e_memory_set_none_value_stored_as_empty_string() -> None:
-    """Test that a value 'None' is stored as a literal string."""
-    res = run_cli(["memory", "set", "nonekey", "None"])
-    assert res.returncode == 0
-    getres = run_cli(["memory", "get", "nonekey"])
-    v = json.loads(getres.stdout)["value"]
-    assert v == "None"
-
-
 def test_e2e_memory_list_format_json_yaml_agree() -> None:
-    """Test that JSON and YAML list outputs contain the same keys."""
-    run_cli(["memory", "set", "a", "1"])
-    run_cli(["memory", "set", "b", "2"])
+    """Test that the JSON and YAML list outputs carry the same payload."""
+    run_cli(["memory", "set", "--stdin"], input_data="a=1\nb=2\n")
     res_json = run_cli(["memory", "list", "--format", "json"])
     res_yaml = run_cli(["memory", "list", "--format", "yaml"])
-    keys_json = set(json.loads(res_json.stdout)["keys"])
-    keys_yaml = set(yaml.safe_load(res_yaml.stdout)["keys"])
-    assert keys_json == keys_yaml
+    assert res_json.returncode == 0
+    assert res_yaml.returncode == 0
+    payload = json_loads(res_json.stdout)
+    assert yaml_loads(res_yaml.stdout) == payload
+    assert set(payload["keys"]) == {"a", "b"}
 
 
 def test_e2e_memory_delete_with_quiet_suppresses_output() -> None:
@@ -379,51 +416,33 @@ def test_e2e_memory_delete_with_quiet_suppresses_output() -> None:
     assert res.stdout.strip() == "" or res.stdout.strip() == "{}"
 
 
-def test_e2e_memory_verbose_root_and_subcommands() -> None:
+@pytest.mark.parametrize(
+    ("argv", "seed"),
+    [
+        (["memory", "--verbose"], None),
+        (["memory", "set", "vkey", "vval", "-v"], None),
+        (["memory", "get", "gvkey", "--verbose"], "gvkey"),
+        (["memory", "delete", "dvkey", "-v"], "dvkey"),
+        (["memory", "list", "--verbose"], "lvkey"),
+        (["memory", "clear", "--verbose"], None),
+    ],
+    ids=["root", "set", "get", "delete", "list", "clear"],
+)
+def test_e2e_memory_verbose_root_and_subcommands(
+    argv: list[str], seed: str | None
+) -> None:
     """Test that --verbose adds context to root and subcommand outputs."""
-    res = run_cli(["memory", "--verbose"])
+    if seed is not None:
+        Memory().set(seed, "x")
+    res = run_cli(argv)
     assert res.returncode == 0
-    data = json.loads(res.stdout)
-    assert "python" in data
-    assert "platform" in data
-
-    res = run_cli(["memory", "set", "vkey", "vval", "-v"])
-    assert res.returncode == 0
-    data = json.loads(res.stdout)
-    assert "python" in data
-    assert "platform" in data
-
-    run_cli(["memory", "set", "gvkey", "gvval"])
-    res = run_cli(["memory", "get", "gvkey", "--verbose"])
-    assert res.returncode == 0
-    data = json.loads(res.stdout)
-    assert "python" in data
-    assert "platform" in data
-
-    run_cli(["memory", "set", "dvkey", "dvval"])
-    res = run_cli(["memory", "delete", "dvkey", "-v"])
-    assert res.returncode == 0
-    data = json.loads(res.stdout)
-    assert "python" in data
-    assert "platform" in data
-
-    run_cli(["memory", "set", "lvkey", "lvval"])
-    res = run_cli(["memory", "list", "--verbose"])
-    assert res.returncode == 0
-    data = json.loads(res.stdout)
-    assert "python" in data
-    assert "platform" in data
-
-    res = run_cli(["memory", "clear", "--verbose"])
-    assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert "python" in data
     assert "platform" in data
 
 
 def test_e2e_memory_pretty_and_no_pretty() -> None:
     """Test the --pretty and --no-pretty flags affect output formatting."""
-    run_cli(["memory", "clear"])
     for k in ("p1", "p2"):
         run_cli(["memory", "set", k, "v"])
     res = run_cli(["memory", "list", "-f", "json", "--pretty"])
@@ -436,15 +455,14 @@ def test_e2e_memory_pretty_and_no_pretty() -> None:
 
 def test_e2e_memory_format_case_insensitive_and_last_wins() -> None:
     """Test format flag is case-insensitive and the last one wins."""
-    run_cli(["memory", "clear"])
     run_cli(["memory", "set", "fk", "fv"])
     res = run_cli(["memory", "get", "fk", "--format", "YAML"])
     assert res.returncode == 0
-    data = yaml.safe_load(res.stdout)
+    data = yaml_loads(res.stdout)
     assert data["value"] == "fv"
     res = run_cli(["memory", "get", "fk", "--format", "yaml", "--format", "json"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert data["value"] == "fv"
 
 
@@ -456,69 +474,53 @@ def test_e2e_memory_subcommand_help_contract(sub: str) -> None:
     assert res.returncode == 0
     out = res.stdout.lower()
     assert out.lstrip().startswith("usage:")
-    for flag in (
-        "-q",
-        "--quiet",
-        "-v",
-        "--verbose",
-        "-f",
-        "--format",
-        "--pretty",
-        "--no-pretty",
-        "-d",
-        "--debug",
-    ):
-        assert flag in out
+    missing = _HELP_FLAGS - set(_FLAG_RE.findall(out))
+    assert not missing, f"Help output is missing flags: {sorted(missing)}"
 
 
 def test_e2e_memory_unknown_flag_errors() -> None:
     """Test that an unknown flag produces a structured error."""
     res = run_cli(["memory", "set", "ukey", "uval", "--notaflag"])
     assert res.returncode == 2
-    payload = json.loads(res.stdout or res.stderr)
+    payload = json_loads(res.stdout or res.stderr)
     assert "error" in payload
     assert payload.get("code") == 2
 
 
-def test_e2e_memory_ascii_hygiene(monkeypatch: Any) -> None:
+@pytest.mark.subprocess
+@pytest.mark.asyncio(loop_scope="module")
+async def test_e2e_memory_ascii_hygiene(memory_children: dict[str, Process]) -> None:
     """Test that non-ASCII environment variables are handled gracefully."""
-    monkeypatch.setenv("BIJUXCLI_CONFIG", "/tmp/\u2603")  # noqa: S108
-    res = run_cli(["memory"])
-    assert res.returncode == 3
-    payload = json.loads(res.stdout or res.stderr)
+    proc = memory_children["ascii"]
+    out, err = await asyncio.wait_for(proc.communicate(), timeout=10)
+    assert proc.returncode == 3
+    payload = json_loads(out or err)
     assert "error" in payload
     assert payload.get("code") == 3
 
 
 def test_e2e_memory_boundary_key_validation() -> None:
-    """Test that invalid keys (too long, contains spaces/newlines) are rejected."""
-    key = "k" * 4097
-    res = run_cli(["memory", "set", key, "v"])
-    assert res.returncode != 0
-    p = json.loads(res.stdout or res.stderr)
-    assert p.get("code") == 2
-
+    """Test that an invalid key is rejected with a structured usage error."""
     res = run_cli(["memory", "set", "bad key", "v"])
-    assert res.returncode != 0
-    p = json.loads(res.stdout or res.stderr)
-    assert p.get("code") == 2
-
-    res = run_cli(["memory", "set", "bad\nkey", "v"])
-    assert res.returncode != 0
-    p = json.loads(res.stdout or res.stderr)
+    assert res.returncode == 2
+    p = json_loads(res.stdout or res.stderr)
     assert p.get("code") == 2
 
 
-def test_e2e_memory_sigint_does_not_leak_traceback(tmp_path: Path) -> None:
+@pytest.mark.subprocess
+@pytest.mark.asyncio(loop_scope="module")
+async def test_e2e_memory_sigint_does_not_leak_traceback(
+    memory_children: dict[str, Process],
+) -> None:
     """Test that interrupting the process does not leak a stack trace."""
-    cmd = [sys.executable, "-m", "bijux_cli", "memory", "list"]
-    proc = Popen(cmd, stdout=PIPE, stderr=PIPE, text=True)  # noqa: S603
-    time.sleep(0.1)
+    proc = memory_children["sigint"]
+    assert proc.stderr is not None
+    while await proc.stderr.readline() not in (b"", b"\x00ready\n"):
+        continue
     proc.send_signal(signal.SIGINT)
-    out, err = proc.communicate(timeout=2)
-    assert proc.returncode != 0
-    msg = (out + err).lower()
-    assert "interrupt" in msg or "signal" in msg
+    out, err = await asyncio.wait_for(proc.communicate(), timeout=2)
+    assert proc.returncode == 130
+    assert b"traceback" not in (out + err).lower()
 
 
 def test_e2e_memory_clear_idempotent_and_concurrent() -> None:
@@ -526,25 +528,16 @@ def test_e2e_memory_clear_idempotent_and_concurrent() -> None:
     run_cli(["memory", "clear"])
     res = run_cli(["memory", "clear"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert "cleared" in data.get("status", "")
 
-    def do_clear() -> None:
-        """Executes the 'memory clear' CLI command."""
-        run_cli(["memory", "clear"])
-
-    def do_list() -> None:
-        """Executes the 'memory list' CLI command."""
-        run_cli(["memory", "list"])
-
-    threads = [threading.Thread(target=do_clear) for _ in range(3)] + [
-        threading.Thread(target=do_list) for _ in range(3)
-    ]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    store = Memory()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(store.clear) for _ in range(3)]
+        futures += [pool.submit(store.keys) for _ in range(3)]
+        for future in futures:
+            future.result()
     res = run_cli(["memory", "list"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert isinstance(data.get("keys"), list)
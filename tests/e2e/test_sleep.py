@@ -6,24 +6,25 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-from pathlib import Path
 import random
+import re
 import signal
 import string
 from subprocess import PIPE, CompletedProcess, Popen
 import sys
-import threading
 import time
 from typing import Any, cast
 
-from hypothesis import HealthCheck, given, settings
+from hypothesis import example, given, settings
 import hypothesis.strategies as st
 import pytest
-import yaml
 
-from tests.e2e.conftest import run_cli
+from tests.e2e.conftest import cli_route, json_loads, run_cli, yaml_loads
+
+pytestmark = [pytest.mark.e2e, pytest.mark.warm_process]
 
 SUPPORTED_FORMATS = ["json", "yaml"]
 VALID_FLAGS = {
@@ -47,7 +48,13 @@ ALL_FLAGS = [
     "--pretty",
 ]
 FORMATS = ["json", "yaml", "bogus", "garbage", ""]
-ALLOWED = "".join(chr(c) for c in range(160, 0x2000))
+_MAXSIZE_STR = str(sys.maxsize)
+_FLOATMAX_STR = str(sys.float_info.max)
+_strict_ascii = pytest.mark.skipif(
+    os.environ.get("BIJUXCLI_STRICT_ASCII", "1") != "1",
+    reason="non-ASCII rejection disabled via BIJUXCLI_STRICT_ASCII",
+)
+_SLEPT_RE = re.compile(r"\bslept:\s*([\d.eE+-]+)")
 
 
 def _flag_value_id(x: Any) -> str:
@@ -58,11 +65,34 @@ def _flag_value_id(x: Any) -> str:
     return str(x)
 
 
+@lru_cache(maxsize=128)
+def _needle_re(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a case-insensitive alternation of ``needles``, once per tuple."""
+    return re.compile("|".join(map(re.escape, needles)), re.IGNORECASE)
+
+
+def _contains_any(out: str, err: str, *needles: str) -> bool:
+    """Return True if either stream mentions any needle, ignoring case."""
+    search = _needle_re(needles).search
+    return bool(search(out) or search(err))
+
+
+def _parse_slept(stdout: str, fmt: str) -> dict[str, Any]:
+    """Extract the ``slept`` field from JSON or YAML sleep output.
+
+    YAML output is a single ``slept: <float>`` mapping, so it is matched
+    with a regex instead of running a YAML parser.
+    """
+    if fmt.lower() != "yaml":
+        return cast(dict[str, Any], json_loads(stdout))
+    m = _SLEPT_RE.search(stdout)
+    assert m, f"No slept field in YAML output: {stdout!r}"
+    return {"slept": float(m.group(1))}
+
+
 def load_output(stdout: str, fmt: str) -> dict[str, Any]:
     """Load JSON or YAML from a string."""
-    loader: Callable[[str], Any] = (
-        json.loads if fmt.lower() == "json" else yaml.safe_load
-    )
+    loader: Callable[[str], Any] = json_loads if fmt.lower() == "json" else yaml_loads
     data = loader(stdout)
     assert isinstance(data, dict)
     return data
@@ -89,7 +119,7 @@ def sleep_flag_permutations(draw: Any) -> list[str]:
 def test_sleep_idempotent() -> None:
     """Test that sleep of the same duration produces same slept field."""
     runs = [
-        json.loads(run_cli(["sleep", "--seconds", "0.05"]).stdout) for _ in range(2)
+        json_loads(run_cli(["sleep", "--seconds", "0.05"]).stdout) for _ in range(2)
     ]
     for run in runs:
         assert "slept" in run
@@ -100,7 +130,7 @@ def test_sleep_zero_seconds() -> None:
     """Test sleep for zero seconds is valid."""
     res = run_cli(["sleep", "--seconds", "0"])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert data["slept"] == 0
 
 
@@ -108,107 +138,113 @@ def test_sleep_negative_seconds() -> None:
     """Test negative duration is a contract error."""
     res = run_cli(["sleep", "--seconds", "-0.5"])
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "non-negative" in msg or "negative" in msg or "error" in msg
+    assert _contains_any(res.stdout, res.stderr, "non-negative", "negative", "error")
 
 
 def test_sleep_missing_seconds() -> None:
     """Test missing required argument fails with usage error."""
     res = run_cli(["sleep"])
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "required" in msg or "seconds" in msg
+    assert _contains_any(res.stdout, res.stderr, "required", "seconds")
 
 
 def test_sleep_seconds_non_numeric() -> None:
     """Test non-numeric input fails contract."""
     res = run_cli(["sleep", "--seconds", "foo"])
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "invalid" in msg or "not a valid float" in msg
+    assert _contains_any(res.stdout, res.stderr, "invalid", "not a valid float")
 
 
-def test_sleep_env_timeout(tmp_path: Path) -> None:
+def test_sleep_env_timeout() -> None:
     """Test BIJUXCLI_COMMAND_TIMEOUT limits sleep duration."""
-    env = os.environ.copy()
-    env["BIJUXCLI_COMMAND_TIMEOUT"] = "0.05"
-    res = run_cli(["sleep", "--seconds", "1"], env=env)
+    res = run_cli(["sleep", "--seconds", "1"], env={"BIJUXCLI_COMMAND_TIMEOUT": "0.05"})
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "timeout" in msg
-
-
-def test_sleep_config_timeout(tmp_path: Path) -> None:
+    assert _contains_any(res.stdout, res.stderr, "timeout")
+
+
+@pytest.fixture(scope="module")
+def sleep_configs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Write the read-only `.env` configs used by the timeout tests once."""
+    root = tmp_path_factory.mktemp("sleep_configs")
+    contents = {
+        "timeout": b"BIJUXCLI_COMMAND_TIMEOUT=0.05\n",
+        "lenient": b"BIJUXCLI_COMMAND_TIMEOUT=1\n",
+        "invalid": b"BIJUXCLI_COMMAND_TIMEOUT=foobar\n",
+        "non_ascii": b"BIJUXCLI_FOO=\xff\n",
+    }
+    paths = {}
+    for name, data in contents.items():
+        cfg = root / f"{name}.env"
+        cfg.write_bytes(data)
+        paths[name] = str(cfg)
+    return paths
+
+
+def test_sleep_config_timeout(sleep_configs: dict[str, str]) -> None:
     """Test config file timeout is honored if env is unset."""
-    cfg = tmp_path / ".env"
-    cfg.write_text("BIJUXCLI_COMMAND_TIMEOUT=0.05\n")
-    env = {"BIJUXCLI_CONFIG": str(cfg)}
+    env = {"BIJUXCLI_CONFIG": sleep_configs["timeout"]}
     res = run_cli(["sleep", "--seconds", "1"], env=env)
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "timeout" in msg
+    assert _contains_any(res.stdout, res.stderr, "timeout")
 
 
-def test_sleep_env_vs_config_timeout_precedence(tmp_path: Path) -> None:
+def test_sleep_env_vs_config_timeout_precedence(
+    sleep_configs: dict[str, str],
+) -> None:
     """Env var timeout wins over config file."""
-    env = os.environ.copy()
-    env["BIJUXCLI_COMMAND_TIMEOUT"] = "0.05"
-    cfg = tmp_path / ".env"
-    cfg.write_text("BIJUXCLI_COMMAND_TIMEOUT=1\n")
-    env["BIJUXCLI_CONFIG"] = str(cfg)
+    env = {
+        "BIJUXCLI_COMMAND_TIMEOUT": "0.05",
+        "BIJUXCLI_CONFIG": sleep_configs["lenient"],
+    }
     res = run_cli(["sleep", "--seconds", "1"], env=env)
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "timeout" in msg
+    assert _contains_any(res.stdout, res.stderr, "timeout")
 
 
-def test_sleep_invalid_timeout_config(tmp_path: Path) -> None:
+def test_sleep_invalid_timeout_config(sleep_configs: dict[str, str]) -> None:
     """Test invalid config timeout triggers contract error."""
-    cfg = tmp_path / ".env"
-    cfg.write_text("BIJUXCLI_COMMAND_TIMEOUT=foobar\n")
-    env = {"BIJUXCLI_CONFIG": str(cfg)}
+    env = {"BIJUXCLI_CONFIG": sleep_configs["invalid"]}
     res = run_cli(["sleep", "--seconds", "0.1"], env=env)
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "timeout" in msg or "invalid" in msg or "error" in msg
+    assert _contains_any(res.stdout, res.stderr, "timeout", "invalid", "error")
 
 
-def test_sleep_ascii_only_env(tmp_path: Path) -> None:
+@_strict_ascii
+def test_sleep_ascii_only_env(sleep_configs: dict[str, str]) -> None:
     """Test non-ASCII in config or env triggers contract error."""
-    cfg = tmp_path / ".env"
-    cfg.write_bytes(b"BIJUXCLI_FOO=\xff\n")
-    env = {"BIJUXCLI_CONFIG": str(cfg)}
+    env = {"BIJUXCLI_CONFIG": sleep_configs["non_ascii"]}
     res = run_cli(["sleep", "--seconds", "0.01"], env=env)
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "ascii" in msg or "encoding" in msg
+    assert _contains_any(res.stdout, res.stderr, "ascii", "encoding")
 
 
 def test_sleep_large_number_fails() -> None:
     """Test huge sleep values fail gracefully."""
-    res = run_cli(["sleep", "--seconds", str(sys.maxsize)])
+    res = run_cli(["sleep", "--seconds", _MAXSIZE_STR])
     assert res.returncode != 0
 
 
-def test_sleep_interrupt_signal() -> None:
-    """Test SIGINT interrupts sleep and returns error."""
-    import shutil
-
-    bijux_path = shutil.which("bijux")
-    assert bijux_path is not None, "Could not find 'bijux' executable in PATH"
+@pytest.mark.subprocess
+def test_sleep_interrupt_signal(bijux_bin: str) -> None:
+    """Test SIGINT during sleep exits 130 with no traceback.
 
+    The signal is sent once the CLI reports ready, so it always lands inside
+    the command, where it surfaces as `click.Abort` and is mapped to 130.
+    """
     proc = Popen(  # noqa: S603
-        [bijux_path, "sleep", "--seconds", "10"],
+        [bijux_bin, "sleep", "--seconds", "10"],
         stdout=PIPE,
         stderr=PIPE,
         text=True,
+        env={**os.environ, "BIJUXCLI_READY_SENTINEL": "1"},
     )
-    time.sleep(0.2)
+    assert proc.stderr is not None
+    while proc.stderr.readline() not in ("", "\x00ready\n"):
+        continue
     proc.send_signal(signal.SIGINT)
     stdout, stderr = proc.communicate(timeout=2)
-    assert proc.returncode not in (None, 0)
-    msg = (stdout + stderr).lower()
-    assert "interrupt" in msg or "signal" in msg or proc.returncode == -signal.SIGINT
+    assert proc.returncode == 130
+    assert not _contains_any(stdout, stderr, "traceback")
 
 
 def test_sleep_flag_combinations() -> None:
@@ -227,12 +263,20 @@ def test_sleep_flag_combinations() -> None:
             assert res.returncode == 0
 
 
-def test_sleep_fuzzed_format() -> None:
+@given(
+    garbage=st.text(
+        alphabet=st.sampled_from(string.printable), min_size=1, max_size=8
+    ).filter(lambda s: s.lower() not in ("json", "yaml") and not s.startswith("-"))
+)
+@example(garbage="xml")
+@example(garbage=" json")
+@example(garbage="YAML\n")
+@settings(max_examples=5, deadline=None)
+def test_sleep_fuzzed_format(garbage: str) -> None:
     """Test invalid/fuzzed format values fail gracefully."""
-    garbage = "".join(random.choices(string.printable, k=8))  # noqa: S311
     res = run_cli(["sleep", "--seconds", "0.01", "--format", garbage])
     assert res.returncode == 2
-    data = json.loads(res.stderr)
+    data = json_loads(res.stderr)
     assert "error" in data
 
 
@@ -252,22 +296,20 @@ def test_sleep_pretty_yaml() -> None:
     assert "\n" in res.stdout
 
 
+@pytest.mark.subprocess
 def test_sleep_parallel_invocations() -> None:
-    """Test concurrent sleep runs do not interfere."""
-    results: list[CompletedProcess[str]] = []
-
-    def run_and_store() -> None:
-        """Helper to run sleep and append result."""
-        results.append(run_cli(["sleep", "--seconds", "0.01"]))
-
-    threads = [threading.Thread(target=run_and_store) for _ in range(2)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    """Test concurrent sleep runs do not interfere.
+
+    The warm worker serializes its calls, so this runs on the subprocess
+    route to get two genuinely concurrent processes.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(
+            pool.map(lambda _: run_cli(["sleep", "--seconds", "0.01"]), range(2))
+        )
     for res in results:
         assert res.returncode == 0
-        assert "slept" in json.loads(res.stdout)
+        assert "slept" in json_loads(res.stdout)
 
 
 def test_command_performance_sleep() -> None:
@@ -282,68 +324,47 @@ def test_command_performance_sleep() -> None:
 def test_sleep_no_stacktrace_warning_leakage() -> None:
     """No traceback/warning leaks in any output."""
     res = run_cli(["sleep", "--seconds", "0.01"])
-    out = (res.stdout + res.stderr).lower()
-    assert "traceback" not in out
-    assert "warning" not in out
+    assert not _contains_any(res.stdout, res.stderr, "traceback", "warning")
 
 
-@pytest.mark.parametrize(
-    ("flag", "value", "loader"),
-    [
-        ("--format", "json", json.loads),
-        ("-f", "json", json.loads),
-        ("--format", "yaml", yaml.safe_load),
-        ("-f", "yaml", yaml.safe_load),
-        ("--format", "JSON", json.loads),
-        ("--format", "YAML", yaml.safe_load),
-    ],
-    ids=_flag_value_id,
-)
-def test_sleep_format_flag(flag: str, value: str, loader: Callable[[str], Any]) -> None:
+def test_sleep_format_flag() -> None:
     """Test --format flag with both JSON and YAML."""
-    res = run_cli(["sleep", "--seconds", "0.01", flag, value])
-    assert res.returncode == 0
-    data = loader(res.stdout)
-    assert "slept" in data
-    assert data["slept"] == pytest.approx(0.01, abs=1e-7)
-
-
-@pytest.mark.parametrize("flag", VALID_FLAGS["quiet"])
-def test_sleep_quiet_flag(flag: str) -> None:
-    """Test --quiet suppresses all output, exit=0 on success."""
-    res = run_cli(["sleep", "--seconds", "0.01", flag])
+    cases = [
+        ("--format", "json"),
+        ("-f", "json"),
+        ("--format", "yaml"),
+        ("-f", "yaml"),
+        ("--format", "JSON"),
+        ("--format", "YAML"),
+    ]
+    for flag, value in cases:
+        res = run_cli(["sleep", "--seconds", "0.01", flag, value])
+        assert res.returncode == 0, f"{flag}={value}"
+        data = _parse_slept(res.stdout, value)
+        assert data["slept"] == pytest.approx(0.01, abs=1e-7), f"{flag}={value}"
+
+
+@pytest.fixture(scope="module")
+def help_output(request: pytest.FixtureRequest) -> str:
+    """Return the output of `bijux sleep --help`, captured once per module."""
+    with cli_route(request):
+        res = run_cli(["sleep", "--help"])
     assert res.returncode == 0
-    assert not res.stdout.strip()
-    assert not res.stderr.strip()
+    return res.stdout
 
 
-@pytest.mark.parametrize("flag", VALID_FLAGS["help"])
-def test_sleep_help_flag(flag: str) -> None:
+def test_sleep_help_flag(help_output: str) -> None:
     """Test help flag emits correct help/usage info."""
-    res = run_cli(["sleep", flag])
-    output = res.stdout
-    assert res.returncode == 0
-    assert output.lstrip().startswith("Usage:") or "Pause execution" in output
+    assert help_output.lstrip().startswith("Usage:") or "Pause execution" in help_output
     for opt in ["--seconds", "--quiet", "--debug", "--format", "--no-pretty"]:
-        assert opt in output
+        assert opt in help_output
 
 
-@pytest.mark.parametrize("flag", VALID_FLAGS["debug"])
-def test_sleep_debug_flag(flag: str) -> None:
-    """Test --debug emits pretty-printed JSON and diagnostics."""
-    res = run_cli(["sleep", "--seconds", "0.01", flag])
+def test_sleep_short_help_flag_is_alias(help_output: str) -> None:
+    """Test -h prints the same help as --help."""
+    res = run_cli(["sleep", "-h"])
     assert res.returncode == 0
-    assert res.stdout.count("\n") >= 1
-    data = json.loads(res.stdout)
-    assert "slept" in data
-
-
-@pytest.mark.parametrize("flag", VALID_FLAGS["debug"])
-def test_sleep_debug_forces_pretty(flag: str) -> None:
-    """Test --debug overrides --no-pretty (still pretty-printed)."""
-    res = run_cli(["sleep", "--seconds", "0.01", flag, "--no-pretty"])
-    assert res.returncode == 0
-    assert res.stdout.count("\n") >= 1
+    assert res.stdout == help_output
 
 
 @pytest.mark.parametrize("fmt", SUPPORTED_FORMATS)
@@ -363,12 +384,48 @@ def test_sleep_default_output(fmt: str) -> None:
         assert res.stdout.count("\n") >= 1
 
 
-@pytest.mark.parametrize("flag", VALID_FLAGS["verbose"])
-def test_sleep_verbose_flag(flag: str) -> None:
-    """Test --verbose does not add fields unless implemented (future)."""
-    res = run_cli(["sleep", "--seconds", "0.01", flag])
-    data = json.loads(res.stdout)
-    assert "slept" in data
+def _is_silent(res: CompletedProcess[str]) -> bool:
+    """Return True when the invocation succeeded and wrote nothing."""
+    return res.returncode == 0 and not res.stdout.strip() and not res.stderr.strip()
+
+
+def _is_multiline_json(res: CompletedProcess[str]) -> bool:
+    """Return True when the invocation succeeded with pretty JSON output."""
+    return (
+        res.returncode == 0
+        and res.stdout.count("\n") >= 1
+        and "slept" in json_loads(res.stdout)
+    )
+
+
+def _is_multiline(res: CompletedProcess[str]) -> bool:
+    """Return True when the invocation succeeded with multi-line output."""
+    return res.returncode == 0 and res.stdout.count("\n") >= 1
+
+
+def _has_slept(res: CompletedProcess[str]) -> bool:
+    """Return True when stdout is JSON carrying the slept field."""
+    return "slept" in json_loads(res.stdout)
+
+
+@pytest.mark.parametrize(
+    ("flags", "check"),
+    [
+        *(pytest.param([f], _is_silent, id=f) for f in VALID_FLAGS["quiet"]),
+        *(pytest.param([f], _is_multiline_json, id=f) for f in VALID_FLAGS["debug"]),
+        *(
+            pytest.param([f, "--no-pretty"], _is_multiline, id=f"{f}--no-pretty")
+            for f in VALID_FLAGS["debug"]
+        ),
+        *(pytest.param([f], _has_slept, id=f) for f in VALID_FLAGS["verbose"]),
+    ],
+)
+def test_sleep_singleton_flag(
+    flags: list[str], check: Callable[[CompletedProcess[str]], bool]
+) -> None:
+    """Test each global flag on its own (quiet, debug, debug over no-pretty, verbose)."""
+    res = run_cli(["sleep", "--seconds", "0.01", *flags])
+    assert check(res), f"flags={flags!r} rc={res.returncode} stdout={res.stdout!r}"
 
 
 @pytest.mark.parametrize(
@@ -379,7 +436,7 @@ def test_sleep_float_and_scientific(value: str) -> None:
     """Test float and scientific notation for seconds."""
     res = run_cli(["sleep", "--seconds", value])
     assert res.returncode == 0
-    data = json.loads(res.stdout)
+    data = json_loads(res.stdout)
     assert data["slept"] == pytest.approx(float(value), abs=1e-7)
 
 
@@ -392,7 +449,7 @@ def test_sleep_invalid_format(flag: str, value: str) -> None:
     """Test invalid --format is a contract error."""
     res = run_cli(["sleep", "--seconds", "0.01", flag, value])
     assert res.returncode == 2
-    data = json.loads(res.stderr)
+    data = json_loads(res.stderr)
     assert "error" in data
     assert "format" in data["error"].lower()
 
@@ -456,7 +513,7 @@ def test_sleep_hypothesis_flags(flags: list[str]) -> None:
             for i, flag in enumerate(flags)
         ):
             assert res.returncode != 0
-            assert "requires an argument" in (res.stdout + res.stderr).lower()
+            assert _contains_any(res.stdout, res.stderr, "requires an argument")
             return
         assert res.returncode == 0
         assert res.stdout.lstrip().startswith("Usage:")
@@ -479,32 +536,35 @@ def test_sleep_hypothesis_flags(flags: list[str]) -> None:
     assert res.returncode == 0, f"Failed with flags: {flags}"
     assert res.stdout.strip(), f"No output: flags={flags!r}"
     try:
-        data = json.loads(res.stdout)
-    except Exception:
-        try:
-            data = yaml.safe_load(res.stdout)
-        except Exception:
-            pytest.fail(f"Output is not JSON or YAML: {res.stdout!r}")
+        data = json_loads(res.stdout)
+    except ValueError:
+        data = _parse_slept(res.stdout, "yaml")
     assert isinstance(data, dict)
     assert "slept" in data
 
 
-@settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
-@given(nonascii=st.text(alphabet=ALLOWED, min_size=1, max_size=10))
+@_strict_ascii
+@given(
+    nonascii=st.text(
+        alphabet=st.characters(
+            min_codepoint=160, max_codepoint=0x1FFF, exclude_categories=("Cs",)
+        ),
+        min_size=1,
+        max_size=10,
+    )
+)
 def test_sleep_non_ascii_arg_fuzz(nonascii: str) -> None:
     """Test rejection of fuzzed non-ASCII arguments."""
     res = run_cli(["sleep", "--seconds", "0.01", "--foo", nonascii])
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "ascii" in msg or "encoding" in msg or "error" in msg
+    assert _contains_any(res.stdout, res.stderr, "ascii", "encoding", "error")
 
 
 def test_sleep_float_overflow() -> None:
     """Test extreme floats (inf/nan/large)."""
-    res = run_cli(["sleep", "--seconds", str(sys.float_info.max)])
+    res = run_cli(["sleep", "--seconds", _FLOATMAX_STR])
     assert res.returncode != 0
-    msg = (res.stdout + res.stderr).lower()
-    assert "timeout" in msg or "error" in msg
+    assert _contains_any(res.stdout, res.stderr, "timeout", "error")
 
 
 base_key = st.text(
@@ -516,21 +576,12 @@ env_val_strategy = st.text(min_size=1, max_size=10)
 
 
 @given(env_key=env_key_strategy, env_val=env_val_strategy)
-@settings(max_examples=10, deadline=None)
 def test_sleep_fuzz_env(env_key: str, env_val: str) -> None:
     """Fuzz a TEST_* env var; `bijux_cli sleep` must always succeed with valid JSON."""
     from hypothesis import assume
 
     assume("\x00" not in env_val)
-    orig = os.environ.get(env_key)
-    try:
-        os.environ[env_key] = env_val
-        res = run_cli(["sleep", "--seconds", "0.01"])
-        assert res.returncode == 0
-        data = json.loads(res.stdout)
-        assert "slept" in data
-    finally:
-        if orig is None:
-            os.environ.pop(env_key, None)
-        else:
-            os.environ[env_key] = orig
+    res = run_cli(["sleep", "--seconds", "0.01"], env={env_key: env_val})
+    assert res.returncode == 0
+    data = json_loads(res.stdout)
+    assert "slept" in data
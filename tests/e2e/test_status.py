@@ -5,25 +5,30 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
 from pathlib import Path
-import random
 import re
+import selectors
 import string
 import subprocess
+from subprocess import CompletedProcess
 import sys
 import threading
 import time
-from typing import Any, cast
+from typing import Any, NamedTuple, NoReturn, cast
 
 from hypothesis import HealthCheck, given, settings
 import hypothesis.strategies as st
 import psutil
 import pytest
-import yaml
 
-from tests.e2e.conftest import run_cli
+from bijux_cli.core.di import DIContainer
+from tests.e2e.conftest import cli_route, run_cli, yaml_loads
+
+pytestmark = [pytest.mark.e2e, pytest.mark.in_process]
 
 SUPPORTED_FORMATS = ["json", "yaml"]
 FORMATS = ["json", "yaml", "bogus", "garbage", ""]
@@ -47,14 +52,23 @@ ALL_FLAGS = [
     "-f",
     "--no-pretty",
 ]
+_ERROR_RE = re.compile(r"error|exception|traceback", re.IGNORECASE)
+_TRACE_RE = re.compile(r"traceback", re.IGNORECASE)
+_JSON_DECODER = json.JSONDecoder()
 ERROR_TERMS = ["error", "not supported", "invalid", "ascii", "non-ascii"]
 
 
 def run_cli_watch(
-    args: list[str], timeout: float = 1.0
+    args: list[str],
+    timeout: float = 1.0,
+    min_lines: int = 2,
+    on_output: Callable[[subprocess.Popen[str]], None] | None = None,
 ) -> tuple[subprocess.Popen[str], list[str], str]:
-    """Spawn the CLI process for watch tests, return process and output lines."""
-    import os
+    """Spawn the CLI process for watch tests, return process and output lines.
+
+    Reading stops once ``min_lines`` lines arrived or ``timeout`` elapsed, and
+    ``on_output`` is called with the still-running process after each read.
+    """
     import signal
 
     proc = subprocess.Popen(  # noqa: S603
@@ -62,25 +76,59 @@ def run_cli_watch(
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
+        bufsize=-1,
         env={**os.environ, "PYTHONUNBUFFERED": "1"},
     )
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    drain = threading.Thread(target=proc.stderr.read, daemon=True)
+    drain.start()
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
     lines: list[str] = []
-    start = time.monotonic()
+    pending = b""
+    deadline = time.monotonic() + timeout
     try:
-        while True:
-            if proc.stdout is None:
-                break
-            line = proc.stdout.readline()
-            if line:
-                lines.append(line)
-                if len(lines) >= 2:
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while len(lines) < min_lines:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
                     break
-            if time.monotonic() - start > timeout:
-                break
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                *complete, pending = (pending + chunk).split(b"\n")
+                lines.extend(line.decode() + "\n" for line in complete)
+                if on_output is not None:
+                    on_output(proc)
     finally:
         proc.send_signal(signal.SIGINT)
         proc.wait(timeout=2)
-    return proc, lines, proc.stdout.read() if proc.stdout else ""
+        drain.join(timeout=2)
+    os.set_blocking(fd, True)
+    rest = [pending]
+    while chunk := os.read(fd, 65536):
+        rest.append(chunk)
+    return proc, lines, b"".join(rest).decode()
+
+
+def _stream_contains(res: CompletedProcess[str], *needles: str) -> bool:
+    """Return True if stdout or stderr contains any needle, ignoring case."""
+    out, err = res.stdout.casefold(), res.stderr.casefold()
+    return any(n in out or n in err for n in needles)
+
+
+def _iter_json_objects(raw: str) -> Iterator[dict[str, Any]]:
+    """Yield each JSON object in a stream of concatenated documents."""
+    idx, length = 0, len(raw)
+    while True:
+        while idx < length and raw[idx].isspace():
+            idx += 1
+        if idx >= length:
+            return
+        obj, idx = _JSON_DECODER.raw_decode(raw, idx)
+        yield obj
 
 
 def _flag_value_id(x: Any) -> str:
@@ -98,7 +146,7 @@ def _flag_value_id(x: Any) -> str:
 
 def load_output(stdout: str, fmt: str) -> dict[str, Any]:
     """Load CLI output into a dictionary based on the format."""
-    loader = json.loads if fmt.lower() == "json" else yaml.safe_load
+    loader = json.loads if fmt.lower() == "json" else yaml_loads
     data = loader(stdout)
     assert isinstance(data, dict), f"Output is not dict: {data!r}"
     return data
@@ -123,27 +171,15 @@ def assert_status_schema(
         assert isinstance(data.get("platform"), str)
 
 
-@pytest.mark.parametrize(
-    ("flag", "value", "loader"),
-    [
-        ("--format", "json", json.loads),
-        ("-f", "json", json.loads),
-        ("--format", "yaml", yaml.safe_load),
-        ("-f", "yaml", yaml.safe_load),
-        ("--format", "JSON", json.loads),
-        ("--format", "YAML", yaml.safe_load),
-    ],
-    ids=_flag_value_id,
-)
-def test_status_format_flag(
-    flag: str, value: str, loader: Callable[[str], Any]
-) -> None:
-    """Test the --format flag with various values."""
-    res = run_cli(["status", flag, value])
-    assert res.returncode == 0, f"Failed: {res.stderr}"
-    data = loader(res.stdout)
-    assert "status" in data
-    assert data["status"] == "ok"
+@pytest.mark.parametrize("fmt", SUPPORTED_FORMATS)
+def test_status_format_flag(fmt: str) -> None:
+    """Test the --format/-f flag, case-insensitively, for each format."""
+    for flag in ("--format", "-f"):
+        for value in (fmt, fmt.upper()):
+            res = run_cli(["status", flag, value])
+            assert res.returncode == 0, f"{flag} {value}: {res.stderr}"
+            data = load_output(res.stdout, value)
+            assert data.get("status") == "ok", f"{flag} {value}: {data!r}"
 
 
 @pytest.mark.parametrize("flag", VALID_FLAGS["quiet"])
@@ -195,10 +231,29 @@ def test_status_verbose_flag(flag: str, fmt: str) -> None:
     assert "platform" in data
 
 
+class _BaselineStatus(NamedTuple):
+    """Read-only `bijux status` results shared by a module's tests."""
+
+    json: CompletedProcess[str]
+    yaml: CompletedProcess[str]
+    verbose: CompletedProcess[str]
+
+
+@pytest.fixture(scope="module")
+def baseline_status(request: pytest.FixtureRequest) -> _BaselineStatus:
+    """Run `status` once per format with no environment overrides."""
+    with cli_route(request):
+        return _BaselineStatus(
+            json=run_cli(["status", "--format", "json"]),
+            yaml=run_cli(["status", "--format", "yaml"]),
+            verbose=run_cli(["status", "-v", "--format", "json"]),
+        )
+
+
 @pytest.mark.parametrize("fmt", SUPPORTED_FORMATS)
-def test_status_default_output(fmt: str) -> None:
+def test_status_default_output(fmt: str, baseline_status: _BaselineStatus) -> None:
     """Test that the default output is pretty-printed."""
-    res = run_cli(["status", "--format", fmt])
+    res = getattr(baseline_status, fmt)
     assert res.returncode == 0
     if fmt == "json":
         assert res.stdout.count("\n") >= 1
@@ -231,34 +286,31 @@ def test_status_debug_forces_pretty(flag: str) -> None:
     assert res.stdout.count("\n") >= 2
 
 
-@pytest.mark.parametrize("flag", VALID_FLAGS["help"])
-def test_status_help_flag_strict(flag: str) -> None:
-    """Test that the help flag shows well-formatted usage info."""
-    res = run_cli(["status", flag])
-    output = res.stdout
+@pytest.fixture(scope="module")
+def status_help_output(request: pytest.FixtureRequest) -> str:
+    """Return the output of `bijux status --help`, captured once per module."""
+    with cli_route(request):
+        res = run_cli(["status", "--help"])
     assert res.returncode == 0
+    return res.stdout
+
+
+def test_status_help_flag_strict(status_help_output: str) -> None:
+    """Test that the help flag shows well-formatted usage info."""
+    output = status_help_output
     assert output.lstrip().startswith("Usage:"), f"Help: {output[:40]!r}"
     assert output.count("\n") < 50, "Help output too long"
     for opt in ALL_FLAGS:
         assert opt in output, f"Help missing: {opt}"
     assert "status" in output
-    assert not re.search(r"error|exception|traceback", output, re.I)
+    assert not _ERROR_RE.search(output)
 
 
-@pytest.mark.parametrize(
-    "args",
-    [
-        ["--quiet", "--verbose"],
-        ["-q", "-v"],
-        ["--format", "yaml", "-q"],
-        ["--verbose", "-f", "yaml"],
-        ["--debug", "--no-pretty"],
-    ],
-)
-def test_status_flag_combinations_success(args: list[str]) -> None:
-    """Test that various flag combinations succeed."""
-    res = run_cli(["status", *args])
+def test_status_short_help_flag_is_alias(status_help_output: str) -> None:
+    """Test that -h prints the same help as --help."""
+    res = run_cli(["status", "-h"])
     assert res.returncode == 0
+    assert res.stdout == status_help_output
 
 
 @pytest.mark.parametrize(
@@ -271,11 +323,10 @@ def test_status_flag_combinations_success(args: list[str]) -> None:
         (["--debug", "--no-pretty"], True),
     ],
 )
-def test_status_flag_combinations_output_precedence(
-    args: list[str], expect_output: bool
-) -> None:
-    """Test flag precedence for output presence (quiet wins)."""
+def test_status_flag_combinations(args: list[str], expect_output: bool) -> None:
+    """Test that flag combinations succeed and quiet wins over output flags."""
     res = run_cli(["status", *args])
+    assert res.returncode == 0
     assert bool(res.stdout.strip()) is expect_output
 
 
@@ -292,7 +343,7 @@ def test_status_invalid_format_strict(flag: str, value: str) -> None:
     data = json.loads(target)
     assert "error" in data
     assert "format" in data["error"].lower()
-    assert not re.search(r"traceback", data["error"], re.I)
+    assert not _TRACE_RE.search(data["error"])
 
 
 def test_status_invalid_flag_contract() -> None:
@@ -307,8 +358,7 @@ def test_status_non_ascii_argument() -> None:
     """Test that non-ASCII arguments are rejected."""
     res = run_cli(["status", "--foo", "café"])
     assert res.returncode != 0
-    err = (res.stdout + res.stderr).lower()
-    assert "ascii" in err or "encoding" in err or "error" in err
+    assert _stream_contains(res, "ascii", "encoding", "error")
 
 
 def test_status_non_ascii_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -316,8 +366,7 @@ def test_status_non_ascii_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("BIJUXCLI_STATUS", "näme")
     res = run_cli(["status"])
     assert res.returncode != 0
-    err = (res.stdout + res.stderr).lower()
-    assert "ascii" in err or "encoding" in err or "error" in err
+    assert _stream_contains(res, "ascii", "encoding", "error")
 
 
 def test_status_env_case_insensitivity(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -336,22 +385,30 @@ def test_status_locale_c(monkeypatch: pytest.MonkeyPatch) -> None:
     json.loads(res.stdout)
 
 
-def test_status_idempotent_fields() -> None:
+def test_status_idempotent_fields(baseline_status: _BaselineStatus) -> None:
     """Test that deterministic fields are identical across runs."""
-    runs = [json.loads(run_cli(["status", "-v"]).stdout) for _ in range(2)]
-    for key in {"status", "python", "platform"}:
-        assert runs[0].get(key) == runs[1].get(key)
-    nondet = set(runs[0]) - {"status", "python", "platform", "version"}
+    raw = baseline_status.verbose.stdout
+    first = json.loads(raw)
+    rerun = run_cli(["status", "-v"]).stdout
+    if rerun != raw:
+        second = json.loads(rerun)
+        for key in {"status", "python", "platform"}:
+            assert first.get(key) == second.get(key)
+    nondet = set(first) - {"status", "python", "platform", "version"}
     assert nondet <= {"timestamp", "uptime"}
 
 
-@pytest.mark.parametrize("flag", [["--format", "json"], ["--verbose"], ["--debug"]])
-def test_status_no_stacktrace_warning_leakage(flag: list[str]) -> None:
+@pytest.mark.parametrize("run", ["json", "verbose", "debug"])
+def test_status_no_stacktrace_warning_leakage(
+    run: str, baseline_status: _BaselineStatus
+) -> None:
     """Test that no internal warnings or tracebacks leak into output."""
-    res = run_cli(["status", *flag])
-    out = (res.stdout + res.stderr).lower()
-    assert "traceback" not in out
-    assert "warning" not in out
+    res = (
+        run_cli(["status", "--debug"])
+        if run == "debug"
+        else getattr(baseline_status, run)
+    )
+    assert not _stream_contains(res, "traceback", "warning")
 
 
 @pytest.mark.parametrize(
@@ -364,41 +421,46 @@ def test_status_no_stacktrace_warning_leakage(flag: list[str]) -> None:
 def test_status_duplicate_flags(args: list[str], expect: str) -> None:
     """Test that the last of a duplicated flag is used."""
     res = run_cli(["status", *args])
-    data = json.loads(res.stdout) if expect == "json" else yaml.safe_load(res.stdout)
+    data = json.loads(res.stdout) if expect == "json" else yaml_loads(res.stdout)
     assert "status" in data
 
 
 @pytest.mark.parametrize("flag", ["--format", "-f"])
-def test_status_fuzzed_format(flag: str) -> None:
+@given(
+    garbage=st.text(alphabet=string.printable, min_size=1, max_size=16).filter(
+        lambda s: s.lower() not in {"json", "yaml"} and not s.startswith("-")
+    )
+)
+@settings(
+    max_examples=20,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+def test_status_fuzzed_format(flag: str, garbage: str) -> None:
     """Test graceful failure with a fuzzed format value."""
-    garbage = "".join(random.choices(string.printable, k=8))  # noqa: S311
     res = run_cli(["status", flag, garbage])
     assert res.returncode == 2
     data = json.loads(res.stdout or res.stderr)
     assert "error" in data
 
 
-def test_command_performance_status() -> None:
-    """Test that the status command executes quickly."""
-    start = time.monotonic()
-    res = run_cli(["status"])
-    elapsed = time.monotonic() - start
+@pytest.mark.subprocess
+@pytest.mark.benchmark(min_rounds=5, max_time=2.0)
+def test_status_perf(benchmark: Any) -> None:
+    """Benchmark `bijux status`; a single call when benchmarks are disabled."""
+    res = benchmark(run_cli, ["status"])
     assert res.returncode == 0
-    assert elapsed < 5.0, f"Too slow: {elapsed:.2f}s"
+    assert "status" in json.loads(res.stdout)
+    if benchmark.stats is not None:
+        assert benchmark.stats["max"] < 5.0
 
 
+@pytest.mark.slow
+@pytest.mark.subprocess
 def test_status_parallel_invocations() -> None:
     """Test that parallel invocations do not interfere with each other."""
-    results: list[Any] = []
-
-    def run_and_store() -> None:
-        results.append(run_cli(["status"]))
-
-    threads = [threading.Thread(target=run_and_store) for _ in range(2)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as pool:
+        results = list(pool.map(lambda _: run_cli(["status"]), range(8)))
     for res in results:
         assert res.returncode == 0
         assert "status" in json.loads(res.stdout)
@@ -421,17 +483,8 @@ def test_status_watch_json_ok() -> None:
     """Test --watch JSON emits ticks and a stop message."""
     _, lines, remainder = run_cli_watch(["--watch", "1.0", "--format", "json"])
     raw = "".join(lines) + remainder
-    outputs, errors = [], []
-    for m in re.finditer(r"\{.*?\}", raw, flags=re.S):
-        chunk = m.group()
-        try:
-            outputs.append(json.loads(chunk))
-        except Exception as e:
-            errors.append((chunk, repr(e)))
-    if not outputs:
-        raise AssertionError(f"No outputs parsed. Raw output:\n{raw}\nErrors: {errors}")
-    if errors:
-        raise AssertionError(f"JSON decode errors: {errors}")
+    outputs = list(_iter_json_objects(raw))
+    assert outputs, f"No outputs parsed. Raw output:\n{raw}"
     assert any(
         o.get("status") == "ok" and isinstance(o.get("ts"), float) for o in outputs
     ), f"No tick entries found in {outputs!r}"
@@ -440,6 +493,13 @@ def test_status_watch_json_ok() -> None:
     )
 
 
+_NONASCII = st.text(
+    alphabet=st.characters(min_codepoint=128, exclude_categories=("C", "Z", "M", "N")),
+    min_size=1,
+    max_size=10,
+)
+
+
 @st.composite
 def status_flag_permutations(draw: Any) -> list[str]:
     """Generate permutations of status command flags for hypothesis testing."""
@@ -462,20 +522,6 @@ def status_flag_permutations(draw: Any) -> list[str]:
     return flags
 
 
-def test_command_performance_status_under_load() -> None:
-    """Test that repeated status calls are consistently fast."""
-    times = []
-    for _ in range(10):
-        t0 = time.perf_counter()
-        res = run_cli(["status"])
-        t1 = time.perf_counter()
-        assert res.returncode == 0
-        assert "status" in json.loads(res.stdout)
-        times.append(t1 - t0)
-    max_time = max(times)
-    assert max_time < 5.0, f"Max single status call too slow: {max_time:.2f}s"
-
-
 def test_status_watch_yaml_rejected() -> None:
     """Test that --watch rejects non-JSON formats like YAML."""
     proc = subprocess.run(  # noqa: S603
@@ -491,11 +537,11 @@ def test_status_watch_yaml_rejected() -> None:
         ],
         capture_output=True,
         text=True,
+        bufsize=-1,
     )
     assert proc.returncode == 2
-    err = proc.stdout + proc.stderr
-    assert "only json output is supported" in err.lower()
-    assert "error" in err.lower()
+    assert _stream_contains(proc, "only json output is supported")
+    assert _stream_contains(proc, "error")
 
 
 def test_status_watch_invalid_interval() -> None:
@@ -504,11 +550,11 @@ def test_status_watch_invalid_interval() -> None:
         [sys.executable, "-m", "bijux_cli", "status", "--watch", "0"],
         capture_output=True,
         text=True,
+        bufsize=-1,
     )
     assert proc.returncode == 2
-    err = proc.stdout + proc.stderr
-    assert "invalid watch interval" in err.lower()
-    assert "error" in err.lower()
+    assert _stream_contains(proc, "invalid watch interval")
+    assert _stream_contains(proc, "error")
 
 
 def assert_error_contract(stdout: str, stderr: str) -> None:
@@ -523,7 +569,6 @@ def assert_error_contract(stdout: str, stderr: str) -> None:
 
 
 @given(flags=status_flag_permutations())
-@settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
 def test_status_hypothesis_flags(flags: list[str]) -> None:
     """Test various flag combinations generated by hypothesis."""
     for i, flag in enumerate(flags):
@@ -557,22 +602,12 @@ def test_status_hypothesis_flags(flags: list[str]) -> None:
     try:
         payload = json.loads(text)
     except json.JSONDecodeError:
-        payload = yaml.safe_load(text)
+        payload = yaml_loads(text)
     assert isinstance(payload, dict)
     assert "status" in payload
 
 
-@settings(max_examples=10, deadline=None)
-@given(
-    nonascii=st.text(
-        alphabet=st.characters(
-            blacklist_categories=["C", "Z", "M", "N"],
-            blacklist_characters=[chr(i) for i in range(128)],
-        ),
-        min_size=1,
-        max_size=10,
-    )
-)
+@given(nonascii=_NONASCII)
 def test_status_non_ascii_arg_fuzz(nonascii: str) -> None:
     """Test rejection of fuzzed non-ASCII arguments."""
     res = run_cli(["status", "--foo", nonascii])
@@ -583,21 +618,7 @@ def test_status_non_ascii_arg_fuzz(nonascii: str) -> None:
 def test_status_watch_golden() -> None:
     """Golden test for watch output (≥1 tick + stop)."""
     _, lines, remainder = run_cli_watch(["--watch", "0.1", "--format", "json"])
-    raw = "".join(lines) + remainder
-    decoder = json.JSONDecoder()
-    objs: list[dict[str, Any]] = []
-    s = raw
-    idx = 0
-    length = len(s)
-    while idx < length:
-        while idx < length and s[idx].isspace():
-            idx += 1
-        if idx >= length:
-            break
-
-        obj, end = decoder.raw_decode(s, idx)
-        objs.append(obj)
-        idx = end
+    objs = list(_iter_json_objects("".join(lines) + remainder))
     ticks = [
         o for o in objs if o.get("status") == "ok" and isinstance(o.get("ts"), float)
     ]
@@ -611,7 +632,6 @@ def test_status_watch_golden() -> None:
         min_value=0, max_value=1.5, allow_nan=False, allow_infinity=False
     )
 )
-@settings(max_examples=10, deadline=None)
 def test_status_watch_fuzz_interval(interval: float) -> None:
     """Fuzz watch interval for validation."""
     if interval <= 0:
@@ -624,11 +644,17 @@ def test_status_watch_fuzz_interval(interval: float) -> None:
 
 def test_status_watch_memory_leak() -> None:
     """Watch mode should not leak memory over time."""
-    proc = psutil.Process()
-    mem_before = proc.memory_info().rss
-    _, _, _ = run_cli_watch(["--watch", "0.1"], timeout=1.0)
-    mem_after = proc.memory_info().rss
-    assert mem_after - mem_before < 5 * 1024 * 1024
+    rss: list[int] = []
+
+    def sample(proc: subprocess.Popen[str]) -> None:
+        """Record the resident set size of the running watch process."""
+        rss.append(psutil.Process(proc.pid).memory_info().rss)
+
+    _, lines, _ = run_cli_watch(
+        ["--watch", "0.1"], timeout=5.0, min_lines=80, on_output=sample
+    )
+    assert len(lines) >= 80, f"Watch produced only {len(lines)} lines"
+    assert rss[-1] - rss[0] < 5 * 1024 * 1024
 
 
 def test_status_help_precedes_and_ignores_other_flag_errors() -> None:
@@ -650,14 +676,11 @@ def test_status_help_precedes_and_ignores_other_flag_errors() -> None:
 
 def test_status_help_precedes_di_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     """ADR Test: --help must short-circuit everything, even a DI container failure."""
-    from typing import NoReturn
 
     def mock_resolve_fails(self: Any, protocol: Any) -> NoReturn:
         """A mock DI resolve method that raises a RuntimeError to test failure handling."""
         raise RuntimeError("Simulated DI Container Crash")
 
-    from bijux_cli.core.di import DIContainer
-
     monkeypatch.setattr(DIContainer, "resolve", mock_resolve_fails)
 
     res = run_cli(["status", "--help"])
@@ -3,7 +3,16 @@
 
 """Functional tests for the Bijux CLI.
 
-These tests exercise end-to-end workflows using subprocess calls to simulate real usage.
+These tests exercise end-to-end workflows through the real `bijux_cli.__main__`
+entry point. `cli` runs it in-process by default; calls that need a real
+process (timeouts, the installed binary) pass ``in_process=False``, and calls
+that inspect ``--debug`` logging use a warm worker process with ``pooled=True``.
+Setting ``BIJUX_INPROC=0`` sends every call through a subprocess. REPL scripts
+always run in a subprocess.
+
+Tests do not depend on one another's state, so the module may be
+distributed per test with ``pytest -n auto --dist=load``.
+
 Behavioral assumptions (aligned to observed CLI behavior in practice):
 - `version` is a command (not a flag).
 - Pretty-formatted JSON can be printed to stdout even without `--format json`.
@@ -15,7 +24,11 @@ Behavioral assumptions (aligned to observed CLI behavior in practice):
 
 from __future__ import annotations
 
+from collections.abc import Generator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import json
+from multiprocessing import get_context
 import os
 from pathlib import Path
 import re
@@ -24,19 +37,25 @@ import signal
 import subprocess
 from subprocess import PIPE, Popen, run
 import sys
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 import yaml
 
+from tests.e2e import cli_worker
+
 ROOT = Path(__file__).resolve().parent.parent.parent
 _template_dir_path = ROOT / "plugin_template"
 TEMPLATE_DIR: Path | None = _template_dir_path if _template_dir_path.exists() else None
 
 
+@functools.cache
 def find_bijux_binary() -> Path:
-    """Locate the `bijux` executable in common dev/test locations."""
+    """Locate the `bijux` executable, trying the cheapest probes first."""
     exe_name = "bijux.exe" if os.name == "nt" else "bijux"
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
 
     override = os.getenv("BIJUX_BIN")
     if override:
@@ -48,24 +67,29 @@ def find_bijux_binary() -> Path:
     if sibling.exists():
         return sibling
 
-    for p in ROOT.glob(f".tox/*/*/{exe_name}"):
-        if p.is_file():
-            return p.resolve()
-
     which = shutil.which("bijux")
     if which:
         return Path(which).resolve()
 
-    local = ROOT / ("Scripts" if os.name == "nt" else "bin") / exe_name
+    local = ROOT / bin_dir / exe_name
     if local.exists():
         return local.resolve()
 
+    for p in ROOT.glob(f".tox/py*/{bin_dir}/{exe_name}"):
+        if p.is_file():
+            return p.resolve()
+
     raise FileNotFoundError("Could not locate 'bijux' binary")
 
 
 BIN = find_bijux_binary()
+IN_PROCESS = os.getenv("BIJUX_INPROC", "1") != "0"
+_DECODER = json.JSONDecoder()
+_YLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_TEST_ENV = {"PYTHONIOENCODING": "utf-8", "BIJUXCLI_TEST_MODE": "1"}
+_BASE_ENV: Mapping[str, str] = MappingProxyType({**os.environ, **_TEST_ENV})
 
-SEMVER = re.compile(r"\b\d+\.\d+\.\d+(?:[0-9A-Za-z\-\.+]*)?\b")
+SEMVER = re.compile(r"\b\d+\.\d+\.\d+(?:[0-9A-Za-z\-\.+]*)?\b", re.ASCII)
 
 
 def _find_version_in_text(text: str) -> str | None:
@@ -100,40 +124,75 @@ class CliResult:
         self.json_err: Any = parsed_err if parsed_err is not None else {}
 
     def _parse_json(self, text: str) -> Any:
-        """Parse JSON from stdout/stderr text, trying line-by-line then as a whole."""
-        if not text:
+        """Decode the first JSON object or array in stdout/stderr text."""
+        starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+        if not starts:
             return None
-        for line in text.strip().splitlines():
-            s = line.strip()
-            if not s:
-                continue
-            try:
-                return json.loads(s)
-            except json.JSONDecodeError:
-                continue
         try:
-            return json.loads(text)
+            return _DECODER.raw_decode(text, min(starts))[0]
         except json.JSONDecodeError:
             return None
 
 
+@functools.cache
+def _cli_pool() -> ProcessPoolExecutor:
+    """Start the pool of warm CLI worker processes on first use."""
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 4),
+        mp_context=get_context("spawn"),
+        initializer=cli_worker.preimport,
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _shutdown_cli_pool() -> Generator[None, None, None]:  # pyright: ignore[reportUnusedFunction]
+    """Stop the warm CLI worker pool, if it was started, after the module."""
+    yield
+    if _cli_pool.cache_info().currsize:
+        _cli_pool().shutdown(cancel_futures=True)
+        _cli_pool.cache_clear()
+
+
 def cli(
     *tokens: str,
     env: dict[str, str] | None = None,
     json_output: bool = False,
     expect_exit_code: int | None = 0,
     timeout: float | None = 5,
+    in_process: bool = True,
+    pooled: bool = False,
 ) -> CliResult:
-    """Run the CLI and return a structured result."""
-    _env = os.environ.copy()
-    _env["PYTHONIOENCODING"] = "utf-8"
-    _env["BIJUXCLI_TEST_MODE"] = "1"
-    if env:
-        _env.update(env)
-
+    """Run the CLI and return a structured result.
+
+    In-process calls ignore ``timeout`` and share the test process's logging
+    setup; pass ``in_process=False`` for commands that only stop when the
+    process is terminated. ``pooled=True`` runs the call in a warm worker
+    process whose logging is reset per call, for assertions on ``--debug``
+    log output; a ``timeout`` of None sends such calls to a subprocess.
+    """
     _tokens = list(tokens)
     if json_output:
         _tokens.extend(["--format", "json"])
+    overrides = {**_TEST_ENV, **(env or {})}
+
+    outcome: tuple[int, str, str] | None = None
+    if IN_PROCESS and pooled and timeout is not None:
+        future = _cli_pool().submit(cli_worker.invoke_fresh, _tokens, env=overrides)
+        outcome = future.result(timeout=timeout)
+    elif IN_PROCESS and in_process and not pooled:
+        outcome = cli_worker.invoke(_tokens, env=overrides)
+    if outcome is not None:
+        rc, stdout, stderr = outcome
+        res = CliResult(
+            args=["bijux", *_tokens], returncode=rc, stdout=stdout, stderr=stderr
+        )
+        if expect_exit_code is not None:
+            assert res.returncode == expect_exit_code, (
+                f"Expected exit {expect_exit_code}, got {res.returncode}. Stderr:\n{res.stderr}"
+            )
+        return res
+
+    _env: Mapping[str, str] = {**_BASE_ENV, **env} if env else _BASE_ENV
 
     if timeout is None:
         cp: subprocess.CompletedProcess[str] = run(  # noqa: S603
@@ -175,12 +234,14 @@ def cli(
     return res
 
 
-_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]", re.ASCII)
 
 
 def _decolorise(text: str) -> str:
     """Remove ANSI escape codes from a string."""
-    return _ANSI_RE.sub("", text or "")
+    if not text or "\x1b" not in text:
+        return text or ""
+    return _ANSI_RE.sub("", text)
 
 
 def _run_repl_script(
@@ -191,11 +252,7 @@ def _run_repl_script(
 ) -> CliResult:
     """Run a series of commands in the CLI's REPL mode."""
     script = "\n".join(lines) + "\n"
-    _env = os.environ.copy()
-    _env["PYTHONIOENCODING"] = "utf-8"
-    _env["BIJUXCLI_TEST_MODE"] = "1"
-    if env:
-        _env.update(env)
+    _env: Mapping[str, str] = {**_BASE_ENV, **env} if env else _BASE_ENV
     proc = Popen(  # noqa: S603
         [str(BIN)], stdin=PIPE, stdout=PIPE, stderr=PIPE, text=True, env=_env, cwd=cwd
     )
@@ -212,18 +269,93 @@ def _run_repl_script(
     )
 
 
+def _batch_cli(specs: list[tuple[str, list[str]]]) -> dict[str, CliResult]:
+    """Run each named argument list once and return the results by name.
+
+    Identical argument lists share one invocation. Every call must exit 0.
+    """
+    runs: dict[tuple[str, ...], CliResult] = {}
+    for _, tokens in specs:
+        key = tuple(tokens)
+        if key not in runs:
+            runs[key] = cli(*key)
+    return {name: runs[tuple(tokens)] for name, tokens in specs}
+
+
 def test_root_help() -> None:
     """Test the root --help command."""
-    r = cli("--help")
+    r = cli("--help", in_process=False)
     out = _decolorise(r.stdout)
     assert "Usage: bijux" in out
     assert "version" in out.lower()
     assert "status" in out.lower()
 
 
+@functools.cache
+def _help_text(command: str) -> str:
+    """Run ``<command> --help`` once and return it lower-cased and decoloured."""
+    return _decolorise(cli(*command.split(), "--help").stdout).lower()
+
+
+@pytest.fixture(scope="module")
+def help_text(request: pytest.FixtureRequest) -> str:
+    """Return the ``--help`` text of the space-separated ``request.param``."""
+    return _help_text(request.param)
+
+
+@pytest.mark.parametrize(
+    ("help_text", "word"),
+    [
+        ("audit", "audit"),
+        ("dev", "dev"),
+        ("docs", "docs"),
+        ("doctor", "doctor"),
+        ("history clear", "clear"),
+        ("memory set", "set"),
+        ("memory list", "list"),
+        ("memory delete", "delete"),
+        ("plugins check", "check"),
+        ("plugins info", "info"),
+        ("plugins install", "install"),
+        ("plugins list", "list"),
+        ("plugins uninstall", "uninstall"),
+        ("plugins scaffold", "scaffold"),
+        ("sleep", "sleep"),
+        ("status", "status"),
+        ("version", "version"),
+    ],
+    indirect=["help_text"],
+)
+def test_command_help(help_text: str, word: str) -> None:
+    """Test that a command's --help output names the command."""
+    assert word in help_text
+
+
+@pytest.mark.parametrize(
+    ("help_text", "group"),
+    [
+        ("doctor", "doctor"),
+        ("history", "history"),
+        ("memory get", "memory"),
+        ("memory clear", "memory"),
+    ],
+    indirect=["help_text"],
+)
+def test_command_help_usage(help_text: str, group: str) -> None:
+    """Test that --help output carries a usage line naming the command group."""
+    assert "usage:" in help_text
+    assert group in help_text
+
+
+@pytest.mark.parametrize("help_text", ["dev"], indirect=True)
+def test_dev_help(help_text: str) -> None:
+    """Test that the dev help output lists its subcommands."""
+    assert "di" in help_text or "list-plugins" in help_text
+
+
 def test_root_version() -> None:
     """`bijux version` should print a semantic-ish version."""
-    r = cli("version")
+    r = cli("version", in_process=False)
     version = None
     try:
         data = json.loads(r.stdout)
@@ -234,73 +366,64 @@ def test_root_version() -> None:
     assert SEMVER.match(version)
 
 
-def test_root_quiet() -> None:
+@pytest.fixture(scope="module")
+def root_results() -> dict[str, CliResult]:
+    """Run each root output-flag variant of ``bijux version`` once."""
+    return _batch_cli(
+        [
+            ("quiet", ["version", "--quiet"]),
+            ("verbose", ["version", "--verbose"]),
+            ("format_json", ["version", "--format", "json"]),
+            ("format_yaml", ["version", "--format", "yaml"]),
+            ("pretty", ["version", "--pretty"]),
+            ("no_pretty", ["version", "--no-pretty"]),
+        ]
+    )
+
+
+def test_root_quiet(root_results: dict[str, CliResult]) -> None:
     """Test that --quiet suppresses output."""
-    r = cli("version", "--quiet")
-    assert r.stdout.strip() == ""
+    assert root_results["quiet"].stdout.strip() == ""
 
 
-def test_root_verbose() -> None:
+def test_root_verbose(root_results: dict[str, CliResult]) -> None:
     """Test that --verbose provides extra output."""
-    r = cli("version", "--verbose")
-    blob = _decolorise(r.stdout).lower()
+    blob = _decolorise(root_results["verbose"].stdout).lower()
     assert "python" in blob or "platform" in blob
 
 
 def test_root_debug() -> None:
     """Test that --debug provides debug output."""
-    r = cli("version", "--debug")
+    r = cli("version", "--debug", pooled=True)
     assert ("debug" in r.stdout.lower()) or ("debug" in r.stderr.lower())
 
 
-def test_root_format_json() -> None:
-    """--format json should be valid JSON with a version field."""
-    r = cli("version", "--format", "json")
-    data = json.loads(r.stdout)
-    version = data.get("version")
-    assert version
-    assert SEMVER.match(version)
-
-
-def test_root_format_yaml() -> None:
-    """--format yaml should be valid YAML with a version field."""
-    r = cli("version", "--format", "yaml")
-    data = yaml.safe_load(r.stdout)
-    version = (data or {}).get("version") if isinstance(data, dict) else None
+@pytest.mark.parametrize("name", ["format_json", "format_yaml", "pretty", "no_pretty"])
+def test_root_format_version(root_results: dict[str, CliResult], name: str) -> None:
+    """Every output format should carry a semantic-ish version."""
+    r = root_results[name]
+    data = (
+        yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
+        if name == "format_yaml"
+        else r.json_out
+    )
+    version = data.get("version") if isinstance(data, dict) else None
     if not version:
         version = _find_version_in_text(r.stdout)
     assert version
     assert SEMVER.match(version)
 
 
-def test_root_pretty() -> None:
-    """--pretty should still contain a valid version (formatting may differ)."""
-    r = cli("version", "--pretty")
-    version = None
-    try:
-        data = json.loads(r.stdout)
-        version = data.get("version")
-    except Exception:
-        version = _find_version_in_text(r.stdout)
-        return
-    assert version
-    assert SEMVER.match(version)
-    assert '  "version"' in r.stdout or "\n" in r.stdout
-
-
-def test_root_no_pretty() -> None:
-    """--no-pretty should still contain a valid version (likely compact)."""
-    r = cli("version", "--no-pretty")
-    version = None
-    try:
-        data = json.loads(r.stdout)
-        version = data.get("version")
-    except Exception:
-        version = _find_version_in_text(r.stdout)
-        return
-    assert version
-    assert SEMVER.match(version)
-    assert '  "version"' not in r.stdout
+@pytest.mark.parametrize(("name", "indented"), [("pretty", True), ("no_pretty", False)])
+def test_root_pretty_layout(
+    root_results: dict[str, CliResult], name: str, indented: bool
+) -> None:
+    """--pretty may indent the JSON payload; --no-pretty must keep it compact."""
+    out = root_results[name].stdout
+    if indented:
+        assert '  "version"' in out or "\n" in out
+    else:
+        assert '  "version"' not in out
 
 
 def test_root_invalid_option() -> None:
@@ -310,18 +433,37 @@ def test_root_invalid_option() -> None:
     assert ("unknown" in msg) or ("invalid" in msg) or ("usage:" in msg)
 
 
-def test_audit_dry_run() -> None:
-    """Test the audit --dry-run command."""
-    r = cli("audit", "--dry-run", json_output=True)
-    assert r.json_out is not None
-    assert r.json_out.get("status") in {"dry-run", "completed", "ok", "success"}
+@pytest.fixture(scope="module")
+def audit_results() -> dict[str, CliResult]:
+    """Run each ``bijux audit`` flag variant once."""
+    return _batch_cli(
+        [
+            ("dry_run", ["audit", "--dry-run", "--format", "json"]),
+            ("real", ["audit", "--format", "json"]),
+            ("format_json", ["audit", "--format", "json"]),
+            ("format_yaml", ["audit", "--format", "yaml"]),
+            ("quiet", ["audit", "--quiet"]),
+            ("verbose", ["audit", "--verbose"]),
+            ("pretty", ["audit", "--pretty"]),
+            ("no_pretty", ["audit", "--no-pretty"]),
+        ]
+    )
 
 
-def test_audit_real() -> None:
-    """Test the audit command."""
-    r = cli("audit", json_output=True)
+@pytest.mark.parametrize(
+    ("name", "statuses"),
+    [
+        ("dry_run", {"dry-run", "completed", "ok", "success"}),
+        ("real", {"completed", "ok", "success"}),
+    ],
+)
+def test_audit_status(
+    audit_results: dict[str, CliResult], name: str, statuses: set[str]
+) -> None:
+    """Test that audit, with and without --dry-run, reports a known status."""
+    r = audit_results[name]
     assert r.json_out is not None
-    assert r.json_out.get("status") in {"completed", "ok", "success"}
+    assert r.json_out.get("status") in statuses
 
 
 def test_audit_invalid_option() -> None:
@@ -329,47 +471,25 @@ def test_audit_invalid_option() -> None:
     cli("audit", "--invalid", expect_exit_code=2)
 
 
-def test_audit_help() -> None:
-    """Test the audit --help command."""
-    r = cli("audit", "--help")
-    assert "audit" in _decolorise(r.stdout.lower())
-
-
-def test_audit_format_json() -> None:
+def test_audit_format_json(audit_results: dict[str, CliResult]) -> None:
     """Test the audit command with JSON output format."""
-    r = cli("audit", "--format", "json")
-    json.loads(r.stdout)
+    json.loads(audit_results["format_json"].stdout)
 
 
-def test_audit_format_yaml() -> None:
+def test_audit_format_yaml(audit_results: dict[str, CliResult]) -> None:
     """Test the audit command with YAML output format."""
-    r = cli("audit", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(audit_results["format_yaml"].stdout, Loader=_YLoader)  # noqa: S506
 
 
-def test_audit_quiet() -> None:
+def test_audit_quiet(audit_results: dict[str, CliResult]) -> None:
     """Test that the quiet flag suppresses audit command output."""
-    r = cli("audit", "--quiet")
-    assert r.stdout.strip() == ""
-
+    assert audit_results["quiet"].stdout.strip() == ""
 
-def test_audit_verbose() -> None:
-    """Test the audit command with verbose output."""
-    r = cli("audit", "--verbose")
-    text = _decolorise(r.stdout.lower())
-    assert "status" in text
 
-
-def test_audit_pretty() -> None:
-    """Test the audit command with pretty-printed output."""
-    r = cli("audit", "--pretty")
-    assert "status" in _decolorise(r.stdout.lower())
-
-
-def test_audit_no_pretty() -> None:
-    """Test the audit command with non-pretty-printed output."""
-    r = cli("audit", "--no-pretty")
-    assert "status" in _decolorise(r.stdout.lower())
+@pytest.mark.parametrize("name", ["verbose", "pretty", "no_pretty"])
+def test_audit_output_flags(audit_results: dict[str, CliResult], name: str) -> None:
+    """Test that audit output still reports a status under each layout flag."""
+    assert "status" in _decolorise(audit_results[name].stdout.lower())
 
 
 def test_config_set(tmp_path: Path) -> None:
@@ -573,18 +693,10 @@ def test_dev_service() -> None:
     assert (r.stdout or r.stderr).strip() != ""
 
 
-def test_dev_help() -> None:
-    """Test the help output for the dev command."""
-    r = cli("dev", "--help")
-    out = _decolorise(r.stdout.lower())
-    assert "dev" in out
-    assert "di" in out or "list-plugins" in out
-
-
 def test_dev_di_format_yaml() -> None:
     """Test the dev di command with YAML output format."""
     r = cli("dev", "di", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_dev_list_plugins_verbose() -> None:
@@ -644,12 +756,6 @@ def test_docs_name(tmp_path: Path) -> None:
     assert out.exists()
 
 
-def test_docs_help() -> None:
-    """Test the help output for the docs command."""
-    r = cli("docs", "--help")
-    assert "docs" in _decolorise(r.stdout.lower())
-
-
 def test_docs_quiet(tmp_path: Path) -> None:
     """Test that the quiet flag suppresses docs command output."""
     out = tmp_path / "spec.json"
@@ -720,12 +826,6 @@ def test_doctor() -> None:
         )
 
 
-def test_doctor_help() -> None:
-    """Test the help output for the doctor command."""
-    r = cli("doctor", "--help")
-    assert "doctor" in _decolorise(r.stdout.lower())
-
-
 def test_doctor_format_json() -> None:
     """Test the doctor command with JSON output format."""
     r = cli("doctor", "--format", "json")
@@ -735,7 +835,7 @@ def test_doctor_format_json() -> None:
 def test_doctor_format_yaml() -> None:
     """Test the doctor command with YAML output format."""
     r = cli("doctor", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_doctor_quiet() -> None:
@@ -766,14 +866,6 @@ def test_doctor_invalid_sub() -> None:
     cli("doctor", "invalid", expect_exit_code=2)
 
 
-def test_doctor_help_sub() -> None:
-    """Test the help output for the doctor command."""
-    r = cli("doctor", "--help")
-    out = _decolorise(r.stdout.lower())
-    assert "usage:" in out
-    assert "doctor" in out
-
-
 def test_help_root() -> None:
     """Test the root help command."""
     r = cli("help")
@@ -801,7 +893,7 @@ def test_help_format_json() -> None:
 def test_help_format_yaml() -> None:
     """Test the help command with YAML output format."""
     r = cli("help", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_help_quiet() -> None:
@@ -872,20 +964,6 @@ def test_history_service_list_sort() -> None:
     assert (r.stdout or r.stderr).strip() != ""
 
 
-def test_history_clear_help() -> None:
-    """Test the help output for the history clear command."""
-    r = cli("history", "clear", "--help")
-    assert "clear" in _decolorise(r.stdout.lower())
-
-
-def test_history_service_help() -> None:
-    """Test the help output for the base history command."""
-    r = cli("history", "--help", expect_exit_code=0)
-    out = _decolorise((r.stdout or "").lower())
-    assert "usage:" in out
-    assert "history" in out
-
-
 def test_history_invalid_sub() -> None:
     """Test that an invalid history subcommand fails."""
     cli("history", "invalid", expect_exit_code=2)
@@ -948,40 +1026,6 @@ def test_memory_clear(tmp_path: Path) -> None:
         assert r2.json_out.get("keys") in ([], None)
 
 
-def test_memory_set_help() -> None:
-    """Test the help output for the memory set command."""
-    r = cli("memory", "set", "--help")
-    assert "set" in _decolorise(r.stdout.lower())
-
-
-def test_memory_get_help() -> None:
-    """Test the help output for the memory get command."""
-    r = cli("memory", "get", "--help", expect_exit_code=0)
-    out = _decolorise(r.stdout.lower())
-    assert "usage:" in out
-    assert "memory" in out
-
-
-def test_memory_list_help() -> None:
-    """Test the help output for the memory list command."""
-    r = cli("memory", "list", "--help")
-    assert "list" in _decolorise(r.stdout.lower())
-
-
-def test_memory_delete_help() -> None:
-    """Test the help output for the memory delete command."""
-    r = cli("memory", "delete", "--help")
-    assert "delete" in _decolorise(r.stdout.lower())
-
-
-def test_memory_clear_help() -> None:
-    """Test the help output for the memory clear command."""
-    r = cli("memory", "clear", "--help", expect_exit_code=0)
-    out = _decolorise(r.stdout.lower())
-    assert "usage:" in out
-    assert "memory" in out
-
-
 def test_plugins_check() -> None:
     """Test the plugins check command for successful execution."""
     r = cli("plugins", "check", json_output=True, expect_exit_code=None)
@@ -1053,42 +1097,6 @@ def test_plugins_uninstall(tmp_path: Path) -> None:
             assert ("not installed" in msg) or ("unknown" in msg) or ("usage" in msg)
 
 
-def test_plugins_check_help() -> None:
-    """Test the help output for the plugins check command."""
-    r = cli("plugins", "check", "--help")
-    assert "check" in _decolorise(r.stdout.lower())
-
-
-def test_plugins_info_help() -> None:
-    """Test the help output for the plugins info command."""
-    r = cli("plugins", "info", "--help")
-    assert "info" in _decolorise(r.stdout.lower())
-
-
-def test_plugins_install_help() -> None:
-    """Test the help output for the plugins install command."""
-    r = cli("plugins", "install", "--help")
-    assert "install" in _decolorise(r.stdout.lower())
-
-
-def test_plugins_list_help() -> None:
-    """Test the help output for the plugins list command."""
-    r = cli("plugins", "list", "--help")
-    assert "list" in _decolorise(r.stdout.lower())
-
-
-def test_plugins_uninstall_help() -> None:
-    """Test the help output for the plugins uninstall command."""
-    r = cli("plugins", "uninstall", "--help")
-    assert "uninstall" in _decolorise(r.stdout.lower())
-
-
-def test_plugins_scaffold_help() -> None:
-    """Test the help output for the plugins scaffold command."""
-    r = cli("plugins", "scaffold", "--help")
-    assert "scaffold" in _decolorise(r.stdout.lower())
-
-
 def test_plugins_check_verbose() -> None:
     """Test the plugins check command with verbose output."""
     r = cli("plugins", "check", "--verbose", expect_exit_code=None)
@@ -1293,12 +1301,6 @@ def test_sleep_negative() -> None:
     cli("sleep", "-1", expect_exit_code=2)
 
 
-def test_sleep_help() -> None:
-    """Test the help output for the sleep command."""
-    r = cli("sleep", "--help")
-    assert "sleep" in _decolorise(r.stdout.lower())
-
-
 def test_sleep_basic() -> None:
     """Test the basic functionality of the sleep command."""
     r = cli("sleep", "0.1", timeout=1, expect_exit_code=None)
@@ -1355,13 +1357,7 @@ def test_status_basic() -> None:
 
 def test_status_watch() -> None:
     """Test the watch functionality of the status command."""
-    r = cli("status", "--watch", "0.1", timeout=2)
-    assert "status" in _decolorise(r.stdout.lower())
-
-
-def test_status_help() -> None:
-    """Test the help output for the status command."""
-    r = cli("status", "--help")
+    r = cli("status", "--watch", "0.1", timeout=2, in_process=False)
     assert "status" in _decolorise(r.stdout.lower())
 
 
@@ -1374,7 +1370,7 @@ def test_status_format_json() -> None:
 def test_status_format_yaml() -> None:
     """Test the status command with YAML output format."""
     r = cli("status", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_status_quiet() -> None:
@@ -1405,12 +1401,6 @@ def test_status_invalid_watch() -> None:
     cli("status", "--watch", "invalid", expect_exit_code=2)
 
 
-def test_version_help() -> None:
-    """Test the help output for the version command."""
-    r = cli("version", "--help")
-    assert "version" in _decolorise(r.stdout.lower())
-
-
 def test_version_format_json() -> None:
     """Test the version command with JSON output format."""
     r = cli("version", "--format", "json")
@@ -1420,7 +1410,7 @@ def test_version_format_json() -> None:
 def test_version_format_yaml() -> None:
     """Test the version command with YAML output format."""
     r = cli("version", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_version_quiet() -> None:
@@ -1443,7 +1433,7 @@ def test_version_invalid_format() -> None:
 
 def test_version_debug() -> None:
     """Test the version command with debug output."""
-    r = cli("version", "--debug")
+    r = cli("version", "--debug", pooled=True)
     assert ("debug" in r.stdout.lower()) or ("debug" in r.stderr.lower())
 
 
@@ -1509,7 +1499,7 @@ def test_config_unset_empty() -> None:
 def test_config_service_format_yaml() -> None:
     """Test the base config command with YAML output format."""
     r = cli("config", "--format", "yaml")
-    yaml.safe_load(r.stdout)
+    yaml.load(r.stdout, Loader=_YLoader)  # noqa: S506
 
 
 def test_config_set_large_value() -> None:
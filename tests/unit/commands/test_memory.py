@@ -6,16 +6,20 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from io import StringIO
 import sys
 from typing import Any
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 from click import Command
 from click.core import Context as ClickContext
+from click.exceptions import MissingParameter
 import pytest
 import typer
 from typer import Context
+from typer.testing import CliRunner
 
+from bijux_cli.commands.memory import memory_app
 from bijux_cli.commands.memory.clear import (
     _build_payload as clear_build_payload,  # pyright: ignore[reportPrivateUsage]
 )
@@ -40,10 +44,16 @@ from bijux_cli.commands.memory.service import (
     memory,
     memory_summary,
 )
+from bijux_cli.commands.memory.set import (
+    _build_batch_payload as set_batch_build_payload,  # pyright: ignore[reportPrivateUsage]
+)
 from bijux_cli.commands.memory.set import (
     _build_payload as set_build_payload,  # pyright: ignore[reportPrivateUsage]
 )
-from bijux_cli.commands.memory.set import set_memory
+from bijux_cli.commands.memory.set import (
+    _is_valid_key,  # pyright: ignore[reportPrivateUsage]
+    set_memory,
+)
 from bijux_cli.commands.memory.utils import resolve_memory_service
 from bijux_cli.core.enums import OutputFormat
 
@@ -596,7 +606,7 @@ def test_set_memory_success(mock_flags: dict[str, Any]) -> None:
     ):
         mock_memory_svc = MagicMock()
         mock_resolve.return_value = mock_memory_svc
-        set_memory("key", "value", **mock_flags)
+        set_memory("key", "value", **mock_flags, from_stdin=False)
         mock_memory_svc.set.assert_called_with("key", "value")
         builder: Callable[[bool], dict[str, Any]] = mock_new_run.call_args.kwargs[
             "payload_builder"
@@ -615,7 +625,7 @@ def test_set_memory_invalid_key(mock_flags: dict[str, Any]) -> None:
     ):
         mock_emit.side_effect = SystemExit
         with pytest.raises(SystemExit):
-            set_memory("", "value", **mock_flags)
+            set_memory("", "value", **mock_flags, from_stdin=False)
         mock_emit.assert_called()
 
 
@@ -633,7 +643,7 @@ def test_set_memory_exception(mock_flags: dict[str, Any]) -> None:
         mock_resolve.return_value = mock_memory_svc
         mock_memory_svc.set.side_effect = Exception("error")
         with pytest.raises(SystemExit):
-            set_memory("key", "value", **mock_flags)
+            set_memory("key", "value", **mock_flags, from_stdin=False)
         mock_emit.assert_called_with(
             "Failed to set memory: error",
             code=1,
@@ -646,6 +656,104 @@ def test_set_memory_exception(mock_flags: dict[str, Any]) -> None:
         )
 
 
+def test_set_memory_from_stdin(mock_flags: dict[str, Any]) -> None:
+    """Set every KEY=VALUE line read from stdin."""
+    with (
+        patch(
+            "bijux_cli.commands.memory.set.validate_common_flags", return_value="json"
+        ),
+        patch("bijux_cli.commands.memory.set.resolve_memory_service") as mock_resolve,
+        patch("bijux_cli.commands.memory.set.new_run_command") as mock_new_run,
+        patch.object(sys, "stdin", StringIO("a=1\n\nb=x=y\na=2\n")),
+    ):
+        mock_memory_svc = MagicMock()
+        mock_resolve.return_value = mock_memory_svc
+        set_memory(None, None, **mock_flags, from_stdin=True)
+        assert mock_memory_svc.set.call_args_list == [
+            call("a", "1"),
+            call("b", "x=y"),
+            call("a", "2"),
+        ]
+        builder: Callable[[bool], dict[str, Any]] = mock_new_run.call_args.kwargs[
+            "payload_builder"
+        ]
+        assert builder(False) == {"status": "updated", "keys": ["a", "b"], "count": 2}
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "stdin", "failure"),
+    [
+        (None, None, "a=1\nnot-a-pair\n", "invalid_argument"),
+        ("key", None, "a=1\n", "invalid_argument"),
+        (None, None, "bad key=1\n", "invalid_key"),
+        (None, None, "\n  \n", "invalid_argument"),
+    ],
+    ids=["malformed-line", "combined-with-key", "invalid-key", "empty-batch"],
+)
+def test_set_memory_from_stdin_rejects_batch(
+    mock_flags: dict[str, Any],
+    key: str | None,
+    value: str | None,
+    stdin: str,
+    failure: str,
+) -> None:
+    """Reject a bad stdin batch before anything is stored."""
+    with (
+        patch(
+            "bijux_cli.commands.memory.set.validate_common_flags", return_value="json"
+        ),
+        patch("bijux_cli.commands.memory.set.resolve_memory_service") as mock_resolve,
+        patch("bijux_cli.commands.memory.set.emit_error_and_exit") as mock_emit,
+        patch.object(sys, "stdin", StringIO(stdin)),
+    ):
+        mock_emit.side_effect = SystemExit
+        with pytest.raises(SystemExit):
+            set_memory(key, value, **mock_flags, from_stdin=True)
+        assert mock_emit.call_args.kwargs["failure"] == failure
+        assert mock_emit.call_args.kwargs["code"] == 2
+        mock_resolve.assert_not_called()
+
+
+def test_set_memory_missing_value(mock_flags: dict[str, Any]) -> None:
+    """Raise Click's missing-argument error when VALUE is omitted without --stdin."""
+    with patch("bijux_cli.commands.memory.set.resolve_memory_service") as mock_resolve:
+        with pytest.raises(MissingParameter):
+            set_memory("key", None, **mock_flags, from_stdin=False)
+        mock_resolve.assert_not_called()
+
+
+def test_set_memory_missing_argument_usage_error() -> None:
+    """Report a missing KEY with Click's standard usage error and message."""
+    result = CliRunner().invoke(memory_app, ["set"])
+    assert result.exit_code == 2
+    assert "Missing argument 'KEY'." in result.output
+
+
+@pytest.mark.parametrize(
+    ("key", "valid"),
+    [
+        ("k", True),
+        ("k" * 4096, True),
+        ("", False),
+        ("k" * 4097, False),
+        ("bad key", False),
+        ("bad\nkey", False),
+        ("bad\tkey", False),
+    ],
+    ids=["single", "max-length", "empty", "too-long", "space", "newline", "tab"],
+)
+def test_set_is_valid_key(key: str, valid: bool) -> None:
+    """Validate memory key length and character boundaries."""
+    assert _is_valid_key(key) is valid
+
+
+def test_set_batch_build_payload() -> None:
+    """Build batch set payload."""
+    payload = set_batch_build_payload(False, ["a", "b"])
+    assert payload == {"status": "updated", "keys": ["a", "b"], "count": 2}
+    assert "python" in set_batch_build_payload(True, [])
+
+
 def test_set_build_payload() -> None:
     """Build set payload."""
     payload = set_build_payload(False, "key", "value")
@@ -23,6 +23,7 @@ import typer
 import bijux_cli.__main__ as main_mod
 from bijux_cli.__main__ import (
     _strip_format_help,
+    announce_ready,
     check_missing_format_argument,
     disable_cli_colors_for_test,
     get_usage_for_args,
@@ -173,6 +174,18 @@ def test_disable_cli_colors_for_test(monkeypatch: pytest.MonkeyPatch) -> None:
     assert os.environ.get("NO_COLOR") == "1"
 
 
+def test_announce_ready_only_when_requested(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that the readiness sentinel is written only when enabled."""
+    monkeypatch.delenv("BIJUXCLI_READY_SENTINEL", raising=False)
+    announce_ready()
+    assert capsys.readouterr().err == ""
+    monkeypatch.setenv("BIJUXCLI_READY_SENTINEL", "1")
+    announce_ready()
+    assert capsys.readouterr().err == "\x00ready\n"
+
+
 def test_main_success_records_history() -> None:
     """Test that a successful command run is recorded in history."""
     monkeypatch = pytest.MonkeyPatch()
@@ -230,6 +243,22 @@ def test_main_help_and_missing_format(
     assert "requires an argument" in parsed["error"]
 
 
+def test_main_help_skips_service_setup(
+    capfd: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that --help is answered before the DI container is set up."""
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError("DI container used")
+
+    monkeypatch.setattr("bijux_cli.__main__.DIContainer.current", fail)
+    monkeypatch.setattr("bijux_cli.__main__.Engine", fail)
+    monkeypatch.setattr(sys, "argv", ["bijux", "status", "--help"])
+    assert main() == 0
+    _, err = capfd.readouterr()
+    assert not err
+
+
 @pytest.mark.parametrize(
     ("exc", "expected_code"),
     [
@@ -267,7 +296,7 @@ def test_main_catches_errors(
 def test_main_catches_command_and_keyboard_and_generic(
     capfd: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that the main entry point catches CommandError, KeyboardInterrupt, and generic exceptions."""
+    """Test that the main entry point catches CommandError, KeyboardInterrupt, Abort, and generic exceptions."""
     from bijux_cli.core.exceptions import CommandError
 
     class CmdErrApp:
@@ -293,6 +322,16 @@ def test_main_catches_command_and_keyboard_and_generic(
     data2 = json.loads(err2)
     assert data2["error"] == "Aborted by user"
 
+    class AbortApp:
+        def __call__(self, args: list[str], standalone_mode: bool = False) -> None:
+            raise click.exceptions.Abort
+
+    monkeypatch.setattr(main_mod, "build_app", AbortApp)
+    rc_abort = main()
+    _, err_abort = capfd.readouterr()
+    assert rc_abort == 130
+    assert json.loads(err_abort) == {"error": "Aborted by user", "code": 130}
+
     class GenApp:
         def __call__(self, args: list[str], standalone_mode: bool = False) -> None:
             raise RuntimeError("oops")